@@ -4,7 +4,7 @@
 
 import Anthropic from '@anthropic-ai/sdk';
 import { getMCPClient } from './mcpClient.js';
-import type { MessageParam, Tool } from '@anthropic-ai/sdk/resources/messages.js';
+import type { MessageParam, TextBlockParam, Tool, Usage } from '@anthropic-ai/sdk/resources/messages.js';
 
 export interface ChatMessage {
   role: 'user' | 'assistant';
@@ -35,9 +35,12 @@ Recipe Search Priority:
 3. Then supplement with Spoonacular if needed
 
 Tool Selection:
+- batch_get(operations): Run several reads (pantry, saved recipes, shopping list, ...) in ONE call - prefer this when you need more than one
+- get_dashboard(): Pantry, expiring items, low stock, chores, tasks and batteries in ONE call
 - list_saved_recipes(): Check user's saved recipes in Grocy
 - get_saved_recipe(name): Get full details of a saved recipe
 - find_recipes(ingredients): Search Spoonacular by ingredients
+- find_recipes_with_details(ingredients, number): Search by ingredients and get full instructions for each hit in ONE call
 - search_recipes(query): Search Spoonacular by recipe name
 
 Workflow:
@@ -47,6 +50,74 @@ Workflow:
 
 Be helpful and concise.`;
 
+const CLAUDE_MODEL = process.env.CLAUDE_MODEL || 'claude-haiku-4-5-20251001';
+
+// Prompt caching is GA on the API, but this SDK version only types `cache_control`
+// under the beta namespace, so breakpoints are layered on top of the stable types.
+const EPHEMERAL_CACHE = { type: 'ephemeral' } as const;
+
+type CachedUsage = Usage & {
+  cache_creation_input_tokens?: number | null;
+  cache_read_input_tokens?: number | null;
+};
+
+type ContentBlocks = Exclude<MessageParam['content'], string>;
+
+// Static system prompt, marked as a cache breakpoint (tools + system are cached together)
+const SYSTEM_BLOCKS = [
+  { type: 'text', text: SYSTEM_PROMPT, cache_control: EPHEMERAL_CACHE },
+] as TextBlockParam[];
+
+// Smallest prefix the API will cache; shorter prefixes silently never hit
+function cacheMinimumTokens(model: string): number {
+  if (model.includes('haiku-4-5')) return 4096;
+  if (model.includes('haiku')) return 2048;
+  return 1024;
+}
+
+// Rough token estimate (~3.5 chars per token for English + JSON schema text)
+function approxTokens(text: string): number {
+  return Math.ceil(text.length / 3.5);
+}
+
+// Conversation history is trimmed by approximate size rather than message count.
+// Trimming drops well below the cap in one step, so the retained prefix (and its
+// prompt-cache entry) stays unchanged for many turns instead of shifting every turn.
+const MAX_HISTORY_TOKENS = 12_000;
+const HISTORY_TRIM_TARGET = 6_000;
+
+// Drop the oldest messages in place once history exceeds the token budget
+export function trimHistory(messages: ChatMessage[]): void {
+  let total = messages.reduce((sum, msg) => sum + approxTokens(msg.content), 0);
+  if (total <= MAX_HISTORY_TOKENS) return;
+
+  let drop = 0;
+  // Always keep the newest message, and start the history on a user turn
+  while (drop < messages.length - 1 && (total > HISTORY_TRIM_TARGET || messages[drop].role !== 'user')) {
+    total -= approxTokens(messages[drop].content);
+    drop++;
+  }
+
+  messages.splice(0, drop);
+  console.log(`✂️ Trimmed ${drop} old messages from history (~${total} tokens kept)`);
+}
+
+// Return a copy of the conversation with a cache breakpoint on the newest content block,
+// so history from earlier turns and tool-loop iterations is read from the prompt cache
+function withHistoryBreakpoint(messages: MessageParam[]): MessageParam[] {
+  if (messages.length === 0) return messages;
+
+  const last = messages[messages.length - 1];
+  const blocks: ContentBlocks =
+    typeof last.content === 'string' ? [{ type: 'text', text: last.content }] : last.content;
+
+  const marked = blocks.map((block, index) =>
+    index === blocks.length - 1 ? { ...block, cache_control: EPHEMERAL_CACHE } : block
+  ) as ContentBlocks;
+
+  return [...messages.slice(0, -1), { role: last.role, content: marked }];
+}
+
 // Helper function to extract text from MCP content
 function extractTextFromContent(content: any): string {
   if (!content) return '';
@@ -63,8 +134,73 @@ function extractTextFromContent(content: any): string {
   return JSON.stringify(content);
 }
 
+// Tools whose output carries recipe cards for the UI carousel
+const RECIPE_SEARCH_TOOLS = new Set(['find_recipes', 'search_recipes', 'find_recipes_with_details']);
+// Of those, the ones whose images only matter to the carousel (find_recipes_with_details
+// keeps them, since the model may pass details.image on to save_recipe_to_grocy_db)
+const CAROUSEL_ONLY_IMAGE_TOOLS = new Set(['find_recipes', 'search_recipes']);
+
+// Grocy bookkeeping fields Claude never needs (raw objects come back from call_grocy_api)
+const NOISY_FIELDS = new Set(['row_created_timestamp', 'userfields', 'picture_file_name']);
+
+// Strip fields Claude doesn't use from a parsed tool result
+function trimToolOutput(value: any, dropImages: boolean): any {
+  if (Array.isArray(value)) {
+    return value.map((item) => trimToolOutput(item, dropImages));
+  }
+  if (!value || typeof value !== 'object') {
+    return value;
+  }
+
+  const trimmed: Record<string, any> = {};
+  for (const [key, field] of Object.entries(value)) {
+    if (NOISY_FIELDS.has(key) || (dropImages && key === 'image')) continue;
+
+    // Descriptions are kept whole: saved Grocy recipes store their ingredients and
+    // instructions there, and Claude has no other way to read them
+    trimmed[key] = trimToolOutput(field, dropImages);
+  }
+  return trimmed;
+}
+
+// Shrink a tool result before it is fed back to Claude: the MCP server pretty-prints
+// JSON, so re-serializing compactly and dropping unused fields cuts input tokens on
+// every later tool-loop iteration. Recipe search images only matter to the UI carousel,
+// which is filled from the untrimmed output.
+function compactToolResult(toolName: string, text: string): string {
+  try {
+    return JSON.stringify(trimToolOutput(JSON.parse(text), CAROUSEL_ONLY_IMAGE_TOOLS.has(toolName)));
+  } catch {
+    return text;
+  }
+}
+
+// Cap on tool calls run at once when Claude requests several in one turn
+const MAX_PARALLEL_TOOLS = 8;
+
+// Run async work over items with at most `limit` in flight, preserving result order
+async function mapWithConcurrency<T, R>(
+  items: T[],
+  limit: number,
+  fn: (item: T) => Promise<R>
+): Promise<R[]> {
+  const results: R[] = new Array(items.length);
+  let next = 0;
+
+  const workers = Array.from({ length: Math.min(limit, items.length) }, async () => {
+    while (next < items.length) {
+      const index = next++;
+      results[index] = await fn(items[index]);
+    }
+  });
+
+  await Promise.all(workers);
+  return results;
+}
+
 export class ChatHandler {
   private anthropic: Anthropic;
+  private claudeTools: Tool[] | null = null;
 
   constructor(apiKey: string) {
     this.anthropic = new Anthropic({
@@ -72,23 +208,48 @@ export class ChatHandler {
     });
   }
 
+  // The MCP server's tool set is fixed for the life of the process, so the Claude
+  // tool schemas are built once instead of re-listing tools on every chat
+  private async getClaudeTools(): Promise<Tool[]> {
+    if (!this.claudeTools) {
+      const mcpClient = await getMCPClient();
+      const toolsList = await mcpClient.listTools();
+
+      // The breakpoint on the last tool caches the whole tool schema array
+      this.claudeTools = toolsList.tools.map((tool, index, all) => ({
+        name: tool.name,
+        description: tool.description || '',
+        input_schema: tool.inputSchema as any,
+        ...(index === all.length - 1 ? { cache_control: EPHEMERAL_CACHE } : {}),
+      })) as Tool[];
+
+      // Tools + system prompt form the cached prefix; warn once if it can never be cached
+      const prefixTokens = approxTokens(SYSTEM_PROMPT + JSON.stringify(this.claudeTools));
+      const minimum = cacheMinimumTokens(CLAUDE_MODEL);
+      if (prefixTokens < minimum) {
+        console.warn(
+          `⚠️ Cacheable prefix is ~${prefixTokens} tokens, below the ${minimum}-token minimum for ${CLAUDE_MODEL}; ` +
+            'the tools/system breakpoints will not produce cache hits'
+        );
+      } else {
+        console.log(`📦 Cacheable prefix ~${prefixTokens} tokens (minimum ${minimum})`);
+      }
+    }
+
+    return this.claudeTools;
+  }
+
   async handleChat(
     messages: ChatMessage[],
-    onToolActivity?: (toolCall: ToolCall) => void
+    onToolActivity?: (toolCall: ToolCall) => void,
+    onTextDelta?: (delta: string) => void,
+    signal?: AbortSignal
   ): Promise<ChatResponse> {
     const mcpClient = await getMCPClient();
+    const claudeTools = await this.getClaudeTools();
 
-    // Get available tools from MCP server
-    const toolsList = await mcpClient.listTools();
-    const claudeTools: Tool[] = toolsList.tools.map((tool) => ({
-      name: tool.name,
-      description: tool.description || '',
-      input_schema: tool.inputSchema as any,
-    }));
-
-    // Convert ChatMessage[] to Anthropic MessageParam[] and limit history to last 10 messages
-    const recentMessages = messages.slice(-10);
-    const anthropicMessages: MessageParam[] = recentMessages.map((msg) => ({
+    // Convert ChatMessage[] to Anthropic MessageParam[] (callers bound history with trimHistory)
+    const anthropicMessages: MessageParam[] = messages.map((msg) => ({
       role: msg.role,
       content: msg.content,
     }));
@@ -98,15 +259,36 @@ export class ChatHandler {
     let extractedRecipes: any[] = [];
 
     for (let iteration = 0; iteration < maxIterations; iteration++) {
+      if (signal?.aborted) {
+        throw new Error('Chat request cancelled');
+      }
+
       console.log(`🔄 Iteration ${iteration + 1}/${maxIterations}`);
 
-      const response = await this.anthropic.messages.create({
-        model: process.env.CLAUDE_MODEL || 'claude-haiku-4-5-20251001',
-        max_tokens: 2048,
-        system: SYSTEM_PROMPT,
-        messages: anthropicMessages,
-        tools: claudeTools,
-      });
+      // Stream so text reaches the client as it is generated; tool_use blocks
+      // are handled from the assembled final message
+      const stream = this.anthropic.messages.stream(
+        {
+          model: CLAUDE_MODEL,
+          max_tokens: 2048,
+          system: SYSTEM_BLOCKS,
+          messages: withHistoryBreakpoint(anthropicMessages),
+          tools: claudeTools,
+        },
+        { signal }
+      );
+
+      if (onTextDelta) {
+        stream.on('text', (delta) => onTextDelta(delta));
+      }
+
+      const response = await stream.finalMessage();
+
+      const usage = response.usage as CachedUsage;
+      console.log(
+        `📊 Tokens: ${usage.input_tokens} in (cache read ${usage.cache_read_input_tokens ?? 0}, ` +
+          `cache write ${usage.cache_creation_input_tokens ?? 0}), ${usage.output_tokens} out`
+      );
 
       // Check if Claude wants to use tools
       if (response.stop_reason === 'tool_use') {
@@ -114,9 +296,11 @@ export class ChatHandler {
           (block) => block.type === 'tool_use'
         );
 
-        // Execute tools
-        const toolResults = await Promise.all(
-          toolUseBlocks.map(async (toolUse: any) => {
+        // Execute sibling tool calls concurrently (results keep tool_use order)
+        const toolResults = await mapWithConcurrency(
+          toolUseBlocks,
+          MAX_PARALLEL_TOOLS,
+          async (toolUse: any) => {
             const toolCall: ToolCall = {
               name: toolUse.name,
               status: 'executing',
@@ -128,10 +312,10 @@ export class ChatHandler {
 
             try {
               const result = await mcpClient.callTool(toolUse.name, toolUse.input);
+              const contentText = extractTextFromContent(result.content);
 
-              // Extract recipe data if this was find_recipes or search_recipes
-              if ((toolUse.name === 'find_recipes' || toolUse.name === 'search_recipes') && result.content) {
-                const contentText = extractTextFromContent(result.content);
+              // Extract recipe data for the carousel if this was a recipe search
+              if (RECIPE_SEARCH_TOOLS.has(toolUse.name) && contentText) {
                 const toolOutput = JSON.parse(contentText);
                 if (toolOutput.recipes) {
                   extractedRecipes = toolOutput.recipes;
@@ -145,7 +329,7 @@ export class ChatHandler {
               return {
                 type: 'tool_result' as const,
                 tool_use_id: toolUse.id,
-                content: extractTextFromContent(result.content),
+                content: compactToolResult(toolUse.name, contentText),
               };
             } catch (error: any) {
               toolCall.status = 'failed';
@@ -159,7 +343,7 @@ export class ChatHandler {
                 is_error: true,
               };
             }
-          })
+          }
         );
 
         // Add assistant response with tool use
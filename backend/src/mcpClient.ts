@@ -17,10 +17,102 @@ export interface MCPTool {
   };
 }
 
+// Verbose tool logging (arguments and a result preview) is opt-in, so the hot
+// path doesn't pay for inspecting large payloads on every call
+const DEBUG_TOOLS = process.env.DEBUG_TOOLS === 'true';
+const RESULT_PREVIEW_CHARS = 200;
+
+// Read-only tools whose results are reused for a short time (TTL in ms).
+// Grocy-backed reads are dropped whenever a state-changing tool runs.
+const GROCY_READ_TOOLS: Record<string, number> = {
+  get_pantry: 30_000,
+  get_product: 30_000,
+  view_shopping_list: 30_000,
+  list_saved_recipes: 30_000,
+  get_saved_recipe: 30_000,
+  check_expiring_products: 30_000,
+  check_low_stock: 30_000,
+  get_chores: 30_000,
+  get_tasks: 30_000,
+  get_batteries: 30_000,
+  batch_get: 30_000,
+  get_dashboard: 30_000,
+};
+
+// Spoonacular data does not depend on pantry state; recipe details are immutable by ID
+const SPOONACULAR_READ_TOOLS: Record<string, number> = {
+  find_recipes: 60 * 60_000,
+  search_recipes: 60 * 60_000,
+  find_recipes_with_details: 60 * 60_000,
+  get_recipe_instructions: 24 * 60 * 60_000,
+};
+
+const MAX_CACHED_RESULTS = 500;
+
+// Optional tuning knobs read by the Python server (see .env.example). The server is
+// spawned with an explicit env, so these are forwarded only when set, leaving its
+// own defaults in place otherwise.
+const FORWARDED_SERVER_ENV = [
+  'HTTP2_ENABLED',
+  'GROCY_STOCK_TTL',
+  'GROCY_PRODUCTS_TTL',
+  'PREFETCH_ENABLED',
+  'SPOONACULAR_CACHE_DIR',
+];
+
+function optionalServerEnv(): Record<string, string> {
+  const env: Record<string, string> = {};
+  for (const name of FORWARDED_SERVER_ENV) {
+    const value = process.env[name];
+    if (value) env[name] = value;
+  }
+  return env;
+}
+
+interface CachedResult {
+  expiresAt: number;
+  result: CallToolResult;
+}
+
+function cacheTtl(name: string): number | undefined {
+  return GROCY_READ_TOOLS[name] ?? SPOONACULAR_READ_TOOLS[name];
+}
+
+function cacheKey(name: string, args: Record<string, any>): string {
+  const sortedArgs = Object.keys(args)
+    .sort()
+    .map((key) => [key, args[key]]);
+  return `${name}:${JSON.stringify(sortedArgs)}`;
+}
+
+// Tools report failures as {"success": false, ...} payloads; those must not be cached
+function isFailedResult(result: CallToolResult): boolean {
+  if (result.isError) return true;
+
+  const textContent = (result.content as any[] | undefined)?.find((item) => item.type === 'text');
+  if (!textContent) return false;
+
+  try {
+    const parsed = JSON.parse(textContent.text);
+    return (
+      typeof parsed === 'object' &&
+      parsed !== null &&
+      (parsed.success === false || 'error' in parsed)
+    );
+  } catch {
+    return false;
+  }
+}
+
 export class PantryBotMCPClient {
   private client: Client | null = null;
   private transport: StdioClientTransport | null = null;
   private isConnected = false;
+  private resultCache: Map<string, CachedResult> = new Map();
+  // Read calls currently running, shared with identical calls that arrive meanwhile
+  private inFlight: Map<string, Promise<CallToolResult>> = new Map();
+  // Bumped on every possible Grocy write so reads that started earlier aren't cached
+  private grocyGeneration = 0;
 
   async initialize(): Promise<void> {
     console.log('🔧 Initializing MCP client...');
@@ -34,6 +126,7 @@ export class PantryBotMCPClient {
         GROCY_API_KEY: process.env.GROCY_API_KEY || '',
         SPOONACULAR_API_KEY: process.env.SPOONACULAR_API_KEY || '',
         RECIPE_DIR: '/app/recipes',
+        ...optionalServerEnv(),
       },
     });
 
@@ -66,16 +159,88 @@ export class PantryBotMCPClient {
       throw new Error('MCP client not initialized');
     }
 
-    console.log(`🔧 Calling tool: ${name}`, args);
+    const ttl = cacheTtl(name);
+    const key = ttl !== undefined ? cacheKey(name, args) : '';
 
-    const result = await this.client.callTool({
+    if (ttl !== undefined) {
+      const cached = this.resultCache.get(key);
+      if (cached && cached.expiresAt > Date.now()) {
+        console.log(`⚡ Tool ${name} served from cache`);
+        return cached.result;
+      }
+      this.resultCache.delete(key);
+
+      const pending = this.inFlight.get(key);
+      if (pending) {
+        console.log(`⚡ Tool ${name} joined in-flight call`);
+        return pending;
+      }
+
+      const call = this.executeTool(name, args, ttl, key);
+      this.inFlight.set(key, call);
+      try {
+        return await call;
+      } finally {
+        if (this.inFlight.get(key) === call) this.inFlight.delete(key);
+      }
+    }
+
+    return this.executeTool(name, args, ttl, key);
+  }
+
+  private async executeTool(
+    name: string,
+    args: Record<string, any>,
+    ttl: number | undefined,
+    key: string
+  ): Promise<CallToolResult> {
+    const generation = this.grocyGeneration;
+
+    if (DEBUG_TOOLS) {
+      console.log(`🔧 Calling tool: ${name}`, args);
+    } else {
+      console.log(`🔧 Calling tool: ${name}`);
+    }
+
+    const result = (await this.client!.callTool({
       name,
       arguments: args,
-    });
+    })) as CallToolResult;
 
     console.log(`✅ Tool ${name} completed`);
+    if (DEBUG_TOOLS) {
+      const first = (result.content as any[])?.[0];
+      const preview = first?.type === 'text' ? first.text.slice(0, RESULT_PREVIEW_CHARS) : '';
+      console.log(`   ↳ ${preview}...`);
+    }
+
+    if (ttl === undefined) {
+      // Anything not known to be read-only may have changed Grocy state
+      this.invalidateGrocyReads();
+    } else if (
+      !isFailedResult(result) &&
+      !(name in GROCY_READ_TOOLS && generation !== this.grocyGeneration)
+    ) {
+      if (this.resultCache.size >= MAX_CACHED_RESULTS) {
+        const oldestKey = this.resultCache.keys().next().value;
+        if (oldestKey !== undefined) this.resultCache.delete(oldestKey);
+      }
+      this.resultCache.set(key, { expiresAt: Date.now() + ttl, result });
+    }
+
+    return result;
+  }
 
-    return result as CallToolResult;
+  private invalidateGrocyReads(): void {
+    this.grocyGeneration++;
+    for (const cache of [this.resultCache, this.inFlight]) {
+      for (const key of cache.keys()) {
+        const toolName = key.slice(0, key.indexOf(':'));
+        if (toolName in GROCY_READ_TOOLS) {
+          cache.delete(key);
+        }
+      }
+    }
   }
 
   async close(): Promise<void> {
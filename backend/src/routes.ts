@@ -4,6 +4,7 @@
 
 import express, { Request, Response } from 'express';
 import { getMCPClient } from './mcpClient.js';
+import type { CallToolResult } from '@modelcontextprotocol/sdk/types.js';
 
 const router = express.Router();
 
@@ -23,6 +24,17 @@ function extractTextFromContent(content: any): string {
   return JSON.stringify(content);
 }
 
+// Tool text is already JSON, so forward it as the response body instead of
+// parsing it only to re-encode it
+function sendToolResult(res: Response, result: CallToolResult): void {
+  const contentText = extractTextFromContent(result.content);
+  if (result.isError || !contentText) {
+    throw new Error(contentText || 'Empty tool result');
+  }
+
+  res.type('application/json').send(contentText);
+}
+
 // Health check
 router.get('/health', async (req: Request, res: Response) => {
   try {
@@ -147,10 +159,7 @@ router.post('/api/recipes', async (req: Request, res: Response) => {
       recipe_content: content,
     });
 
-    const contentText = extractTextFromContent(result.content);
-    const resultContent = JSON.parse(contentText);
-
-    res.json(resultContent);
+    sendToolResult(res, result);
   } catch (error: any) {
     console.error('❌ Error saving recipe:', error);
     res.status(500).json({ error: error.message });
@@ -165,10 +174,7 @@ router.get('/api/pantry/summary', async (req: Request, res: Response) => {
       category: 'all',
     });
 
-    const contentText = extractTextFromContent(result.content);
-    const content = JSON.parse(contentText);
-
-    res.json(content);
+    sendToolResult(res, result);
   } catch (error: any) {
     console.error('❌ Error fetching pantry:', error);
     res.status(500).json({ error: error.message });
@@ -183,10 +189,7 @@ router.get('/api/pantry/:category', async (req: Request, res: Response) => {
       category: req.params.category,
     });
 
-    const contentText = extractTextFromContent(result.content);
-    const content = JSON.parse(contentText);
-
-    res.json(content);
+    sendToolResult(res, result);
   } catch (error: any) {
     console.error('❌ Error fetching pantry:', error);
     res.status(500).json({ error: error.message });
@@ -199,10 +202,7 @@ router.get('/api/shopping', async (req: Request, res: Response) => {
     const mcpClient = await getMCPClient();
     const result = await mcpClient.callTool('view_shopping_list', {});
 
-    const contentText = extractTextFromContent(result.content);
-    const content = JSON.parse(contentText);
-
-    res.json(content);
+    sendToolResult(res, result);
   } catch (error: any) {
     console.error('❌ Error fetching shopping list:', error);
     res.status(500).json({ error: error.message });
@@ -4,7 +4,7 @@
 
 import { WebSocketServer, WebSocket } from 'ws';
 import { Server } from 'http';
-import { ChatHandler, ChatMessage, ToolCall } from './chatHandler.js';
+import { ChatHandler, ChatMessage, ToolCall, trimHistory } from './chatHandler.js';
 import crypto from 'crypto';
 
 interface ClientMessage {
@@ -14,8 +14,9 @@ interface ClientMessage {
 }
 
 interface ServerMessage {
-  type: 'message' | 'typing' | 'tool_activity' | 'recipes' | 'error' | 'conversation_started';
+  type: 'message' | 'message_delta' | 'typing' | 'tool_activity' | 'recipes' | 'error' | 'conversation_started';
   message?: ChatMessage;
+  delta?: string;
   tool?: ToolCall;
   recipes?: any[];
   value?: boolean;
@@ -23,10 +24,17 @@ interface ServerMessage {
   conversationId?: string;
 }
 
+// Tool call without its payloads, for sending to the client and keeping in history
+function summarizeToolCall({ name, status }: ToolCall): ToolCall {
+  return { name, status };
+}
+
 interface ChatSession {
   conversationId: string;
   messages: ChatMessage[];
   ws: WebSocket;
+  // Aborted when the socket closes so in-flight Claude generation stops early
+  abortController: AbortController;
 }
 
 export class ChatWebSocketServer {
@@ -47,6 +55,7 @@ export class ChatWebSocketServer {
         conversationId,
         messages: [],
         ws,
+        abortController: new AbortController(),
       };
 
       this.sessions.set(conversationId, session);
@@ -86,6 +95,7 @@ export class ChatWebSocketServer {
       ws.on('close', () => {
         console.log('👋 WebSocket connection closed');
         clearInterval(pingInterval);
+        session.abortController.abort();
         this.sessions.delete(conversationId);
       });
 
@@ -154,6 +164,7 @@ export class ChatWebSocketServer {
     };
 
     session.messages.push(userMsg);
+    trimHistory(session.messages);
 
     // Send typing indicator
     this.sendMessage(session.ws, {
@@ -166,12 +177,21 @@ export class ChatWebSocketServer {
       const response = await this.chatHandler.handleChat(
         session.messages,
         (toolCall: ToolCall) => {
-          // Send real-time tool activity
+          // Send real-time tool activity (the UI only shows name and status, so the
+          // raw tool input/output is not serialized to the client)
           this.sendMessage(session.ws, {
             type: 'tool_activity',
-            tool: toolCall,
+            tool: summarizeToolCall(toolCall),
           });
-        }
+        },
+        (delta: string) => {
+          // Stream assistant text as it is generated
+          this.sendMessage(session.ws, {
+            type: 'message_delta',
+            delta,
+          });
+        },
+        session.abortController.signal
       );
 
       // Add assistant message to history
@@ -180,11 +200,14 @@ export class ChatWebSocketServer {
         content: response.message,
         timestamp: new Date(),
         recipes: response.recipes,
-        toolCalls: response.toolCalls,
+        toolCalls: response.toolCalls.map(summarizeToolCall),
       };
 
       session.messages.push(assistantMsg);
 
+      // Keep long-lived connections from accumulating unbounded history
+      trimHistory(session.messages);
+
       // Send typing indicator off
       this.sendMessage(session.ws, {
         type: 'typing',
@@ -9,6 +9,7 @@ export default function ChatPage() {
   const [isConnected, setIsConnected] = useState(false);
   const [isTyping, setIsTyping] = useState(false);
   const [toolActivity, setToolActivity] = useState<string>('');
+  const [streamingText, setStreamingText] = useState('');
   const messagesEndRef = useRef<HTMLDivElement>(null);
 
   const ws = getWebSocketService();
@@ -24,17 +25,25 @@ export default function ChatPage() {
       setMessages((prev) => [...prev, message]);
       setIsTyping(false);
       setToolActivity('');
+      setStreamingText('');
+    });
+
+    ws.onMessageDelta((delta) => {
+      setStreamingText((prev) => prev + delta);
     });
 
     ws.onTyping((typing) => {
       setIsTyping(typing);
       if (!typing) {
         setToolActivity('');
+        setStreamingText('');
       }
     });
 
     ws.onToolActivity((activity) => {
       if (activity.status === 'executing') {
+        // Text streamed before a tool call is preamble; the final message replaces it
+        setStreamingText('');
         setToolActivity(`${getToolDisplayName(activity.name)}...`);
       }
     });
@@ -65,7 +74,7 @@ export default function ChatPage() {
   // Auto-scroll to bottom
   useEffect(() => {
     messagesEndRef.current?.scrollIntoView({ behavior: 'smooth' });
-  }, [messages, isTyping]);
+  }, [messages, isTyping, streamingText]);
 
   const handleSend = () => {
     if (!input.trim() || !isConnected) return;
@@ -104,6 +113,7 @@ export default function ChatPage() {
     const names: Record<string, string> = {
       get_pantry: 'Checking your pantry',
       find_recipes: 'Searching for recipes',
+      find_recipes_with_details: 'Searching for recipes',
       get_recipe_instructions: 'Getting recipe details',
       use_ingredients: 'Updating inventory',
       purchase_groceries: 'Adding to pantry',
@@ -176,8 +186,19 @@ export default function ChatPage() {
                 </div>
               ))}
 
+              {/* Streaming assistant reply */}
+              {isTyping && streamingText && (
+                <div className="flex justify-start">
+                  <div className="max-w-[70%] rounded-lg px-4 py-2 bg-gray-100 text-gray-900">
+                    <ReactMarkdown className="prose prose-sm max-w-none">
+                      {streamingText}
+                    </ReactMarkdown>
+                  </div>
+                </div>
+              )}
+
               {/* Typing indicator */}
-              {isTyping && (
+              {isTyping && !streamingText && (
                 <div className="flex justify-start">
                   <div className="bg-gray-100 rounded-lg px-4 py-2">
                     <div className="flex items-center gap-2">
@@ -26,6 +26,7 @@ export interface ToolActivity {
 }
 
 type MessageHandler = (message: ChatMessage) => void;
+type MessageDeltaHandler = (delta: string) => void;
 type TypingHandler = (isTyping: boolean) => void;
 type ToolActivityHandler = (activity: ToolActivity) => void;
 type RecipesHandler = (recipes: Recipe[]) => void;
@@ -42,6 +43,7 @@ export class WebSocketService {
 
   // Event handlers
   private onMessageHandler: MessageHandler | null = null;
+  private onMessageDeltaHandler: MessageDeltaHandler | null = null;
   private onTypingHandler: TypingHandler | null = null;
   private onToolActivityHandler: ToolActivityHandler | null = null;
   private onRecipesHandler: RecipesHandler | null = null;
@@ -113,6 +115,12 @@ export class WebSocketService {
         }
         break;
 
+      case 'message_delta':
+        if (data.delta) {
+          this.onMessageDeltaHandler?.(data.delta);
+        }
+        break;
+
       case 'typing':
         this.onTypingHandler?.(data.value);
         break;
@@ -186,6 +194,10 @@ export class WebSocketService {
     this.onMessageHandler = handler;
   }
 
+  onMessageDelta(handler: MessageDeltaHandler): void {
+    this.onMessageDeltaHandler = handler;
+  }
+
   onTyping(handler: TypingHandler): void {
     this.onTypingHandler = handler;
   }
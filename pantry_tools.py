@@ -4,12 +4,22 @@ Used by both HTTP server (Open WebUI) and MCP server (Claude Desktop)
 """
 
 import os
+import re
+import time
+import heapq
+import random
+import asyncio
+import hashlib
 import logging
-from typing import Dict, Any
-from datetime import datetime
+import tempfile
+from itertools import islice
+from operator import itemgetter
+from typing import Dict, Any, Optional, Tuple, Callable, Awaitable
+from datetime import datetime, timedelta
 from pathlib import Path
 
 import httpx
+import orjson
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -22,10 +32,13 @@ logger = logging.getLogger("pantrybot")
 GROCY_API_URL = os.getenv("GROCY_API_URL", "http://192.168.0.83:9283/api")
 GROCY_API_KEY = os.getenv("GROCY_API_KEY", "")
 SPOONACULAR_API_KEY = os.getenv("SPOONACULAR_API_KEY", "")
+SPOONACULAR_API_URL = "https://api.spoonacular.com"
 RECIPE_DIR = Path(os.getenv("RECIPE_DIR", "/app/recipes"))
+SPOONACULAR_CACHE_DIR = Path(os.getenv("SPOONACULAR_CACHE_DIR", str(RECIPE_DIR / ".spoonacular_cache")))
 
-# Ensure recipe directory exists
+# Ensure recipe and cache directories exist
 RECIPE_DIR.mkdir(exist_ok=True, parents=True)
+SPOONACULAR_CACHE_DIR.mkdir(exist_ok=True, parents=True)
 
 
 def get_grocy_headers() -> dict:
@@ -37,338 +50,754 @@ def get_grocy_headers() -> dict:
 
 
 # ============================================================================
-# GROCY PANTRY TOOLS
+# SHARED HTTP CLIENTS
 # ============================================================================
 
-async def get_pantry_items(category: str = "all") -> Dict[str, Any]:
-    """Get condensed pantry items from Grocy"""
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                f"{GROCY_API_URL}/stock",
-                headers=get_grocy_headers(),
-                timeout=10.0
-            )
-            response.raise_for_status()
-            stock_data = response.json()
-
-            condensed_items = []
-            for item in stock_data:
-                product = item.get("product", {})
-                amount = float(item.get("amount_aggregated", 0))
-
-                if amount <= 0:
-                    continue
+# Connection pool shared by every tool call, so sequential requests within a
+# chat turn reuse keep-alive connections instead of paying a new handshake each.
+# HTTP/2 lets concurrent calls multiplex over one connection; httpx negotiates it
+# via TLS ALPN only, so plain-http Grocy installs keep using HTTP/1.1. Set
+# HTTP2_ENABLED=false for reverse proxies that advertise h2 but handle it badly.
+HTTP2_ENABLED = os.getenv("HTTP2_ENABLED", "true").lower() != "false"
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=40, keepalive_expiry=60)
+# Connection failures are retried by the transport (nothing was sent, so any method
+# is safe); 5xx responses are only retried for GETs, see _get_with_retry
+HTTP_CONNECT_RETRIES = 3
+GET_RETRY_ATTEMPTS = 3
+
+_grocy_client: Optional[httpx.AsyncClient] = None
+_spoonacular_client: Optional[httpx.AsyncClient] = None
+
+
+def _make_transport() -> httpx.AsyncHTTPTransport:
+    # Pool limits and HTTP/2 are transport settings once a transport is passed explicitly
+    return httpx.AsyncHTTPTransport(limits=HTTP_LIMITS, http2=HTTP2_ENABLED, retries=HTTP_CONNECT_RETRIES)
+
+
+def _get_grocy_client() -> httpx.AsyncClient:
+    """Get the shared pooled client for Grocy API requests (created on first use)"""
+    global _grocy_client
+    if _grocy_client is None or _grocy_client.is_closed:
+        # Auth headers are fixed for the process, so they live on the client
+        _grocy_client = httpx.AsyncClient(
+            base_url=GROCY_API_URL,
+            headers=get_grocy_headers(),
+            timeout=10.0,
+            transport=_make_transport()
+        )
+    return _grocy_client
+
+
+def _get_spoonacular_client() -> httpx.AsyncClient:
+    """Get the shared pooled client for Spoonacular API requests (created on first use)"""
+    global _spoonacular_client
+    if _spoonacular_client is None or _spoonacular_client.is_closed:
+        # The API key rides along as a default query param on every request
+        _spoonacular_client = httpx.AsyncClient(
+            base_url=SPOONACULAR_API_URL,
+            params={"apiKey": SPOONACULAR_API_KEY},
+            timeout=10.0,
+            transport=_make_transport()
+        )
+    return _spoonacular_client
+
+
+# Spoonacular enforces per-minute quotas, so bursts of chained tool calls are capped
+# and throttled (429) or failed (5xx) responses are retried with a jittered backoff
+SPOONACULAR_CONCURRENCY = 8
+SPOONACULAR_RETRY_ATTEMPTS = 4
+SPOONACULAR_MAX_BACKOFF = 8.0
+_spoonacular_semaphore = asyncio.Semaphore(SPOONACULAR_CONCURRENCY)
+
+
+async def _spoonacular_get(path: str, params: Dict[str, Any]) -> httpx.Response:
+    """GET from Spoonacular under the concurrency cap, retrying 429/5xx responses"""
+    client = _get_spoonacular_client()
+    for attempt in range(SPOONACULAR_RETRY_ATTEMPTS):
+        async with _spoonacular_semaphore:
+            response = await client.get(path, params=params, timeout=10.0)
+        if response.status_code != 429 and response.status_code < 500:
+            return response
+        if attempt == SPOONACULAR_RETRY_ATTEMPTS - 1:
+            break
 
-                # Apply filtering
-                if category != "all":
-                    if category == "expiring_soon":
-                        best_before = item.get("best_before_date", "")
-                        if best_before:
-                            exp_date = datetime.strptime(best_before, "%Y-%m-%d")
-                            if (exp_date - datetime.now()).days > 7:
-                                continue
-                    elif category == "low_stock":
-                        min_stock = float(product.get("min_stock_amount", 0))
-                        if amount >= min_stock:
-                            continue
-                    elif category.lower() not in product.get("name", "").lower():
-                        continue
+        # Honour Retry-After (seconds form) when Spoonacular sends it
+        retry_after = response.headers.get("Retry-After", "")
+        delay = float(retry_after) if retry_after.isdigit() else 2 ** attempt + random.random()
+        delay = min(delay, SPOONACULAR_MAX_BACKOFF)
+        logger.warning(f"⚠️ Spoonacular returned HTTP {response.status_code}, retrying in {delay:.1f}s")
+        await asyncio.sleep(delay)
+    return response
+
+
+async def _get_with_retry(client: httpx.AsyncClient, url: str, **kwargs) -> httpx.Response:
+    """GET that retries 5xx responses with a short exponential backoff (GETs are idempotent)"""
+    for attempt in range(GET_RETRY_ATTEMPTS - 1):
+        response = await client.get(url, **kwargs)
+        if response.status_code < 500:
+            return response
+        logger.warning(f"⚠️ {url} returned HTTP {response.status_code}, retrying")
+        await asyncio.sleep(0.1 * 2 ** attempt)
+    return await client.get(url, **kwargs)
+
+
+async def close_http_clients() -> None:
+    """Close the shared HTTP clients and their pooled connections (call on shutdown)"""
+    global _grocy_client, _spoonacular_client
+    for client in (_grocy_client, _spoonacular_client):
+        if client is not None and not client.is_closed:
+            await client.aclose()
+    _grocy_client = None
+    _spoonacular_client = None
+
+
+def _describe_error(e: Exception) -> str:
+    """Short error text for tool results and logs"""
+    # str() of an HTTPStatusError embeds the full request URL, which includes the
+    # Spoonacular apiKey query parameter; the status line is all callers need
+    if isinstance(e, httpx.HTTPStatusError):
+        return f"HTTP {e.response.status_code} {e.response.reason_phrase}"
+    return str(e)
 
-                condensed_items.append({
-                    "name": product.get("name", "Unknown"),
-                    "amount": amount,
-                    "best_before": item.get("best_before_date", "N/A")
-                })
 
-            return {
-                "success": True,
-                "total_products": len(condensed_items),
-                "items": condensed_items
-            }
+# ============================================================================
+# SPOONACULAR DISK CACHE
+# ============================================================================
 
-        except Exception as e:
-            return {
-                "success": False,
-                "error": f"Failed to fetch pantry items: {str(e)}"
-            }
+# Recipe details are keyed by stable Spoonacular IDs and never change, so they
+# are cached with no expiry; ingredient searches shift as the catalog grows
+INGREDIENT_SEARCH_TTL = 6 * 3600
+# Searches that matched nothing are still cached (so retries don't burn quota)
+# but expire sooner, since a typo fix or a new pantry item often follows
+EMPTY_SEARCH_TTL = 30 * 60
 
 
-async def get_product_info(product_name: str) -> Dict[str, Any]:
-    """Get detailed info about a specific product"""
-    async with httpx.AsyncClient() as client:
+def _cache_path(key: str) -> Path:
+    """Get the cache file for a key"""
+    return SPOONACULAR_CACHE_DIR / f"{key}.json"
+
+
+def _read_cache_file(path: Path, ttl: Optional[float], empty_ttl: Optional[float]) -> Optional[Dict[str, Any]]:
+    # A missing file surfaces as OSError, so there's no separate exists() check
+    try:
+        age = time.time() - path.stat().st_mtime
+        if ttl is not None and age > ttl:
+            return None
+        data = orjson.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if empty_ttl is not None and age > empty_ttl and not data.get("recipes"):
+        return None
+    return data
+
+
+def _write_file_atomic(path: Path, content: bytes) -> None:
+    # Write then rename so a concurrent reader never sees a partial file; each writer
+    # gets its own temp file, so concurrent saves of the same path can't collide
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            # mkstemp creates 0600; keep the permissions a plain write would give
+            os.fchmod(tmp_file.fileno(), 0o644)
+            tmp_file.write(content)
+        os.replace(tmp_name, path)
+    except BaseException:
         try:
-            response = await client.get(
-                f"{GROCY_API_URL}/stock",
-                headers=get_grocy_headers(),
-                timeout=10.0
-            )
-            response.raise_for_status()
-            stock_data = response.json()
-
-            matches = []
-            for item in stock_data:
-                product = item.get("product", {})
-                name = product.get("name", "")
-
-                if product_name.lower() in name.lower():
-                    matches.append({
-                        "name": name,
-                        "amount": float(item.get("amount_aggregated", 0)),
-                        "amount_opened": float(item.get("amount_opened_aggregated", 0)),
-                        "best_before": item.get("best_before_date", "N/A"),
-                        "min_stock_amount": product.get("min_stock_amount", 0)
-                    })
-
-            if matches:
-                return {"found": True, "matches": matches}
-            else:
-                return {"found": False, "message": f"No products found matching '{product_name}'"}
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
 
-        except Exception as e:
-            return {"error": f"Failed to fetch product info: {str(e)}"}
 
+def _write_cache_file(path: Path, data: Dict[str, Any]) -> None:
+    _write_file_atomic(path, orjson.dumps(data))
 
-async def find_product_id_by_name(product_name: str) -> Dict[str, Any]:
-    """Helper function to find Grocy product ID by name"""
-    async with httpx.AsyncClient() as client:
-        try:
-            # Get all products from Grocy
-            response = await client.get(
-                f"{GROCY_API_URL}/objects/products",
-                headers=get_grocy_headers(),
-                timeout=10.0
-            )
-            response.raise_for_status()
-            products = response.json()
-
-            # Search for matching product
-            matches = []
-            for product in products:
-                name = product.get("name", "")
-                if product_name.lower() in name.lower():
-                    matches.append({
-                        "id": product.get("id"),
-                        "name": name
-                    })
-
-            if matches:
-                return {"found": True, "matches": matches}
-            else:
-                return {"found": False, "message": f"No product found matching '{product_name}'"}
 
-        except Exception as e:
-            return {"error": f"Failed to search for product: {str(e)}"}
+async def _cache_get(
+    key: str,
+    ttl: Optional[float] = None,
+    empty_ttl: Optional[float] = None
+) -> Optional[Dict[str, Any]]:
+    """Read a cached Spoonacular result, or None if missing or expired (empty searches use empty_ttl)"""
+    return await asyncio.to_thread(_read_cache_file, _cache_path(key), ttl, empty_ttl)
 
 
-async def consume_stock(product_name: str, amount: float, spoiled: bool = False) -> Dict[str, Any]:
-    """Consume/remove stock from Grocy inventory"""
-    logger.info(f"🗑️ Consuming {amount} of '{product_name}' (spoiled: {spoiled})")
+async def _cache_set(key: str, data: Dict[str, Any]) -> None:
+    """Store a Spoonacular result on disk (failures are logged, never raised)"""
+    try:
+        await asyncio.to_thread(_write_cache_file, _cache_path(key), data)
+    except OSError as e:
+        logger.warning(f"⚠️ Could not write Spoonacular cache {key}: {_describe_error(e)}")
 
-    # First, find the product ID
-    product_search = await find_product_id_by_name(product_name)
-    if not product_search.get("found"):
-        return {"success": False, "error": f"Product '{product_name}' not found in Grocy"}
 
-    matches = product_search.get("matches", [])
-    if len(matches) > 1:
-        # Multiple matches - let user know
-        match_names = [m["name"] for m in matches]
-        return {
-            "success": False,
-            "error": f"Multiple products found: {', '.join(match_names)}. Please be more specific."
-        }
+def _ingredient_search_key(ingredients: str, number: int) -> str:
+    """Cache key for an ingredient search, independent of ingredient order and case"""
+    normalized = ",".join(sorted(i.strip().lower() for i in ingredients.split(",") if i.strip()))
+    digest = hashlib.sha1(f"{normalized}|{number}".encode()).hexdigest()
+    return f"search_{digest}"
+
+
+_spoonacular_in_flight: Dict[str, asyncio.Task] = {}
+
+
+async def _spoonacular_shared(key: str, fetch: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+    """Run fetch once per cache key; concurrent identical calls await the same request"""
+    task = _spoonacular_in_flight.get(key)
+    if task is None:
+        task = asyncio.create_task(fetch())
+        _spoonacular_in_flight[key] = task
+        task.add_done_callback(
+            lambda t: _spoonacular_in_flight.get(key) is t and _spoonacular_in_flight.pop(key)
+        )
+    # Shielded so one cancelled caller doesn't cancel the request for the others
+    return await asyncio.shield(task)
+
+
+# ============================================================================
+# GROCY SNAPSHOTS
+# ============================================================================
+
+# get_pantry_items and get_product_info both read the full /stock list (and
+# get_expiring_soon/get_missing_products share /stock/volatile), and a chat turn
+# often calls them back to back; reuse one snapshot for a few seconds
+GROCY_STOCK_TTL = float(os.getenv("GROCY_STOCK_TTL", "10"))
+# The product catalog (and the locations/units new products use) only changes
+# when something is created, which invalidates it
+GROCY_PRODUCTS_TTL = float(os.getenv("GROCY_PRODUCTS_TTL", "30"))
+
+# A meal-planning turn that reads stock usually reads the saved recipes next (and
+# vice versa), so fetching one warms the other in the background
+PREFETCH_ENABLED = os.getenv("PREFETCH_ENABLED", "true").lower() != "false"
+
+STOCK_ENDPOINT = "/stock"
+VOLATILE_ENDPOINT = "/stock/volatile"
+RECIPES_ENDPOINT = "/objects/recipes"
+PRODUCTS_ENDPOINT = "/objects/products"
+LOCATIONS_ENDPOINT = "/objects/locations"
+QUANTITY_UNITS_ENDPOINT = "/objects/quantity_units"
+CHORES_ENDPOINT = "/objects/chores"
+TASKS_ENDPOINT = "/objects/tasks"
+BATTERIES_ENDPOINT = "/objects/batteries"
+
+
+def _index_stock(stock_data: list) -> Tuple[list, list]:
+    # Name lookups run against the snapshot repeatedly, so lower-case names once per fetch.
+    # Grocy's /stock entries always embed the product, so fields are read directly.
+    names_lower = [item["product"]["name"].lower() for item in stock_data]
+    return stock_data, names_lower
+
+
+def _index_products(products: list) -> Tuple[list, list, Dict[str, dict]]:
+    # find_product_id_by_name runs several times per write tool (and per recipe ingredient):
+    # exact names resolve with one dict probe, everything else scans pre-lowered names
+    names_lower = [product["name"].lower() for product in products]
+    by_exact_name: Dict[str, dict] = {}
+    for product, name_lower in zip(products, names_lower):
+        by_exact_name.setdefault(name_lower, product)
+    return products, names_lower, by_exact_name
+
+
+def _index_by_name(items: list) -> Tuple[list, Dict[str, dict]]:
+    # Grocy objects looked up by exact (case-insensitive) name; the first one wins
+    by_name: Dict[str, dict] = {}
+    for item in items:
+        by_name.setdefault(item.get("name", "").lower(), item)
+    return items, by_name
+
+
+# How each snapshot endpoint's decoded JSON is stored, and which endpoint it prefetches
+SNAPSHOT_BUILDERS = {
+    STOCK_ENDPOINT: _index_stock,
+    VOLATILE_ENDPOINT: lambda volatile: volatile,
+    RECIPES_ENDPOINT: lambda recipes: recipes,
+    PRODUCTS_ENDPOINT: _index_products,
+    LOCATIONS_ENDPOINT: _index_by_name,
+    QUANTITY_UNITS_ENDPOINT: _index_by_name,
+    CHORES_ENDPOINT: _index_by_name,
+    TASKS_ENDPOINT: _index_by_name,
+    BATTERIES_ENDPOINT: _index_by_name,
+}
+SNAPSHOT_TTLS = {
+    STOCK_ENDPOINT: GROCY_STOCK_TTL,
+    VOLATILE_ENDPOINT: GROCY_STOCK_TTL,
+    RECIPES_ENDPOINT: GROCY_STOCK_TTL,
+    PRODUCTS_ENDPOINT: GROCY_PRODUCTS_TTL,
+    LOCATIONS_ENDPOINT: GROCY_PRODUCTS_TTL,
+    QUANTITY_UNITS_ENDPOINT: GROCY_PRODUCTS_TTL,
+    CHORES_ENDPOINT: GROCY_PRODUCTS_TTL,
+    TASKS_ENDPOINT: GROCY_PRODUCTS_TTL,
+    BATTERIES_ENDPOINT: GROCY_PRODUCTS_TTL,
+}
+SNAPSHOT_PREFETCH = {
+    STOCK_ENDPOINT: RECIPES_ENDPOINT,
+    RECIPES_ENDPOINT: STOCK_ENDPOINT,
+}
+# Grocy sends no ETag/Last-Modified, but exposes when its database last changed; an
+# expired snapshot of these rarely-changing lists is kept if that time hasn't moved
+REVALIDATED_SNAPSHOTS = {
+    RECIPES_ENDPOINT, PRODUCTS_ENDPOINT, LOCATIONS_ENDPOINT, QUANTITY_UNITS_ENDPOINT,
+    CHORES_ENDPOINT, TASKS_ENDPOINT, BATTERIES_ENDPOINT,
+}
+# Only grocy_api writes under these paths change the snapshot, so other writes
+# (e.g. creating a product or executing a chore) leave it alone
+WRITE_SCOPED_SNAPSHOTS = {
+    LOCATIONS_ENDPOINT: (LOCATIONS_ENDPOINT,),
+    QUANTITY_UNITS_ENDPOINT: (QUANTITY_UNITS_ENDPOINT,),
+    CHORES_ENDPOINT: (CHORES_ENDPOINT,),
+    TASKS_ENDPOINT: (TASKS_ENDPOINT, "/tasks"),  # completing a task flips its "done" flag
+    BATTERIES_ENDPOINT: (BATTERIES_ENDPOINT,),
+}
+DB_CHANGED_TIME_ENDPOINT = "/system/db-changed-time"
+
+# endpoint -> (fetched at, indexed value, Grocy db-changed-time seen before the fetch)
+_snapshots: Dict[str, Tuple[float, Any, Optional[str]]] = {}
+_snapshot_fetches: Dict[str, asyncio.Task] = {}
+
+
+async def _get_db_changed_time() -> Optional[str]:
+    """Grocy's last database change time, or None if it can't be read"""
+    client = _get_grocy_client()
+    try:
+        response = await _get_with_retry(
+            client,
+            DB_CHANGED_TIME_ENDPOINT,
+            timeout=10.0
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content).get("changed_time")
+    except Exception as e:
+        logger.warning(f"⚠️ Could not read Grocy db-changed-time: {_describe_error(e)}")
+        return None
+
+
+async def _load_snapshot(endpoint: str) -> Any:
+    client = _get_grocy_client()
+    changed_time = None
+    if endpoint in REVALIDATED_SNAPSHOTS:
+        # Read before the list itself, so a change during the fetch still shows up next time
+        changed_time = await _get_db_changed_time()
+        cached = _snapshots.get(endpoint)
+        if changed_time is not None and cached is not None and cached[2] == changed_time:
+            if _snapshot_fetches.get(endpoint) is asyncio.current_task():
+                _snapshots[endpoint] = (time.monotonic(), cached[1], changed_time)
+            return cached[1]
+
+    response = await _get_with_retry(
+        client,
+        endpoint,
+        timeout=10.0
+    )
+    response.raise_for_status()
+    value = SNAPSHOT_BUILDERS[endpoint](orjson.loads(response.content))
 
-    product_id = matches[0]["id"]
-    product_exact_name = matches[0]["name"]
+    # A write while this request was in flight invalidated it; don't cache stale data
+    if _snapshot_fetches.get(endpoint) is asyncio.current_task():
+        _snapshots[endpoint] = (time.monotonic(), value, changed_time)
+    return value
 
-    async with httpx.AsyncClient() as client:
+
+def _is_fresh(endpoint: str) -> bool:
+    cached = _snapshots.get(endpoint)
+    return cached is not None and time.monotonic() - cached[0] < SNAPSHOT_TTLS[endpoint]
+
+
+def _start_snapshot_fetch(endpoint: str) -> asyncio.Task:
+    """Get the in-flight fetch for an endpoint, starting one if needed"""
+    task = _snapshot_fetches.get(endpoint)
+    if task is None or task.done():
+        task = asyncio.create_task(_load_snapshot(endpoint))
+        # Prefetches may never be awaited; retrieve their exception so it isn't reported as lost
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        _snapshot_fetches[endpoint] = task
+    return task
+
+
+async def _fetch_snapshot(endpoint: str) -> Any:
+    """Get a Grocy endpoint snapshot, sharing one request between concurrent callers"""
+    if _is_fresh(endpoint):
+        value = _snapshots[endpoint][1]
+    else:
+        task = _start_snapshot_fetch(endpoint)
         try:
-            response = await client.post(
-                f"{GROCY_API_URL}/stock/products/{product_id}/consume",
-                headers=get_grocy_headers(),
-                json={
-                    "amount": amount,
-                    "spoiled": spoiled,
-                    "transaction_type": "consume"
-                },
-                timeout=10.0
-            )
-            response.raise_for_status()
-
-            logger.info(f"✅ Consumed {amount} of '{product_exact_name}' from inventory")
+            # Shielded so one cancelled caller doesn't cancel the fetch for the others
+            value = await asyncio.shield(task)
+        finally:
+            if _snapshot_fetches.get(endpoint) is task and task.done():
+                del _snapshot_fetches[endpoint]
 
-            return {
-                "success": True,
-                "message": f"Successfully consumed {amount} of '{product_exact_name}'",
-                "product_name": product_exact_name,
-                "amount": amount,
-                "spoiled": spoiled
-            }
+    companion = SNAPSHOT_PREFETCH.get(endpoint)
+    if PREFETCH_ENABLED and companion and not _is_fresh(companion):
+        _start_snapshot_fetch(companion)
 
-        except Exception as e:
-            logger.error(f"❌ Failed to consume stock: {str(e)}")
-            return {
-                "success": False,
-                "error": f"Failed to consume stock: {str(e)}"
-            }
+    return value
 
 
-async def add_stock(product_name: str, amount: float, best_before_date: str = None, price: float = None) -> Dict[str, Any]:
-    """Add stock to Grocy inventory"""
-    logger.info(f"📦 Adding {amount} of '{product_name}' to inventory")
+# Catalog lists the write tools resolve names against (product, location, unit);
+# loading them at startup keeps the first create/add off the cold path
+WARMUP_SNAPSHOTS = (PRODUCTS_ENDPOINT, LOCATIONS_ENDPOINT, QUANTITY_UNITS_ENDPOINT)
 
-    # First, find the product ID
-    product_search = await find_product_id_by_name(product_name)
-    if not product_search.get("found"):
-        # Auto-create the product if it doesn't exist
-        logger.info(f"🆕 Product '{product_name}' not found, creating it...")
-        create_result = await create_product(product_name)
 
-        if not create_result.get("success"):
-            return {"success": False, "error": f"Product '{product_name}' not found and could not be created: {create_result.get('error')}"}
+def warm_grocy_snapshots() -> None:
+    """Start background fetches of the catalog snapshots (a failed one is retried on first use)"""
+    if PREFETCH_ENABLED:
+        for endpoint in WARMUP_SNAPSHOTS:
+            _start_snapshot_fetch(endpoint)
+
+
+async def _fetch_stock() -> Tuple[list, list]:
+    """Get the Grocy /stock list and its lower-cased product names"""
+    return await _fetch_snapshot(STOCK_ENDPOINT)
 
-        # Re-search for the newly created product
-        product_search = await find_product_id_by_name(product_name)
-        if not product_search.get("found"):
-            return {"success": False, "error": f"Product '{product_name}' was created but could not be found"}
 
-    matches = product_search.get("matches", [])
-    if len(matches) > 1:
-        match_names = [m["name"] for m in matches]
+def invalidate_grocy_snapshots(*endpoints: str) -> None:
+    """Drop the given snapshots (or all of them) after a write that changes them"""
+    endpoints = endpoints or tuple(SNAPSHOT_BUILDERS)
+    for name in endpoints:
+        _snapshots.pop(name, None)
+        _snapshot_fetches.pop(name, None)
+
+
+# ============================================================================
+# GROCY PANTRY TOOLS
+# ============================================================================
+
+async def get_pantry_items(category: str = "all") -> Dict[str, Any]:
+    """Get condensed pantry items from Grocy"""
+    try:
+        stock_data, names_lower = await _fetch_stock()
+
+        # Loop invariants, computed once rather than per stock item.
+        # Grocy dates are ISO (YYYY-MM-DD), which sort as strings, so the expiry
+        # filter compares against a cutoff string instead of parsing every date;
+        # the cutoff keeps the previous whole-day rule ((best_before - now).days <= 7).
+        expiry_cutoff = (datetime.now() + timedelta(days=8)).date().isoformat()
+        category_lower = category.lower()
+
+        condensed_items = []
+        for item, name_lower in zip(stock_data, names_lower):
+            product = item["product"]
+            amount = float(item["amount_aggregated"])
+
+            if amount <= 0:
+                continue
+
+            best_before = item.get("best_before_date")
+
+            # Apply filtering
+            if category != "all":
+                if category == "expiring_soon":
+                    if best_before and best_before > expiry_cutoff:
+                        continue
+                elif category == "low_stock":
+                    min_stock = float(product.get("min_stock_amount", 0))
+                    if amount >= min_stock:
+                        continue
+                elif category_lower not in name_lower:
+                    continue
+
+            condensed_items.append({
+                "name": product["name"],
+                "amount": amount,
+                "best_before": best_before or "N/A"
+            })
+
+        return {
+            "success": True,
+            "total_products": len(condensed_items),
+            "items": condensed_items
+        }
+
+    except Exception as e:
         return {
             "success": False,
-            "error": f"Multiple products found: {', '.join(match_names)}. Please be more specific."
+            "error": f"Failed to fetch pantry items: {_describe_error(e)}"
         }
 
-    product_id = matches[0]["id"]
-    product_exact_name = matches[0]["name"]
 
-    async with httpx.AsyncClient() as client:
-        try:
-            # Build request body
-            body = {
-                "amount": amount,
-                "transaction_type": "purchase"
-            }
+async def get_product_info(product_name: str, max_matches: int = 10) -> Dict[str, Any]:
+    """Get detailed info about a specific product (at most max_matches entries)"""
+    try:
+        stock_data, names_lower = await _fetch_stock()
+        needle = product_name.lower()
+
+        matches = []
+        for item, name_lower in zip(stock_data, names_lower):
+            if needle in name_lower:
+                if len(matches) >= max_matches:
+                    # A further match exists; stop scanning and let the caller know
+                    return {"found": True, "matches": matches, "more_matches": True}
+                product = item["product"]
+                matches.append({
+                    "name": product["name"],
+                    "amount": float(item["amount_aggregated"]),
+                    "amount_opened": float(item.get("amount_opened_aggregated", 0)),
+                    "best_before": item.get("best_before_date", "N/A"),
+                    "min_stock_amount": product.get("min_stock_amount", 0)
+                })
+
+        if matches:
+            return {"found": True, "matches": matches}
+        else:
+            return {"found": False, "message": f"No products found matching '{product_name}'"}
 
-            if best_before_date:
-                body["best_before_date"] = best_before_date
+    except Exception as e:
+        return {"error": f"Failed to fetch product info: {_describe_error(e)}"}
 
-            if price is not None:
-                body["price"] = price
 
-            response = await client.post(
-                f"{GROCY_API_URL}/stock/products/{product_id}/add",
-                headers=get_grocy_headers(),
-                json=body,
-                timeout=10.0
-            )
-            response.raise_for_status()
+async def find_product_id_by_name(product_name: str) -> Dict[str, Any]:
+    """Helper function to find Grocy product ID by name"""
+    try:
+        # Get all products from Grocy (shared snapshot with pre-lowered names)
+        products, names_lower, by_exact_name = await _fetch_snapshot(PRODUCTS_ENDPOINT)
+        needle = product_name.lower()
+
+        # An exact name wins outright, so "milk" isn't ambiguous with "almond milk"
+        exact = by_exact_name.get(needle)
+        if exact is not None:
+            return {"found": True, "matches": [{"id": exact["id"], "name": exact["name"]}]}
+
+        # Otherwise search for products containing the name
+        matches = [
+            {"id": product["id"], "name": product["name"]}
+            for product, name_lower in zip(products, names_lower)
+            if needle in name_lower
+        ]
+
+        if matches:
+            return {"found": True, "matches": matches}
+        else:
+            return {"found": False, "message": f"No product found matching '{product_name}'"}
 
-            logger.info(f"✅ Added {amount} of '{product_exact_name}' to inventory")
+    except Exception as e:
+        return {"error": f"Failed to search for product: {_describe_error(e)}"}
 
-            return {
-                "success": True,
-                "message": f"Successfully added {amount} of '{product_exact_name}' to inventory",
-                "product_name": product_exact_name,
-                "amount": amount,
-                "best_before_date": best_before_date,
-                "price": price
-            }
 
-        except Exception as e:
-            logger.error(f"❌ Failed to add stock: {str(e)}")
+async def consume_stock(product_name: str, amount: float, spoiled: bool = False, product_id: Optional[int] = None) -> Dict[str, Any]:
+    """Consume/remove stock from Grocy inventory"""
+    logger.info(f"🗑️ Consuming {amount} of '{product_name}' (spoiled: {spoiled})")
+
+    if product_id is not None:
+        # Caller already knows the Grocy ID, so skip the catalog lookup
+        product_exact_name = product_name
+    else:
+        # First, find the product ID
+        product_search = await find_product_id_by_name(product_name)
+        if not product_search.get("found"):
+            return {"success": False, "error": f"Product '{product_name}' not found in Grocy"}
+
+        matches = product_search.get("matches", [])
+        if len(matches) > 1:
+            # Multiple matches - let user know
+            match_names = [m["name"] for m in matches]
             return {
                 "success": False,
-                "error": f"Failed to add stock: {str(e)}"
+                "error": f"Multiple products found: {', '.join(match_names)}. Please be more specific."
             }
 
+        product_id = matches[0]["id"]
+        product_exact_name = matches[0]["name"]
 
-async def add_to_shopping_list(product_name: str, amount: float = 1) -> Dict[str, Any]:
-    """Add item to Grocy shopping list"""
-    logger.info(f"🛒 Adding {amount} of '{product_name}' to shopping list")
+    client = _get_grocy_client()
+    try:
+        response = await client.post(
+            f"/stock/products/{product_id}/consume",
+            json={
+                "amount": amount,
+                "spoiled": spoiled,
+                "transaction_type": "consume"
+            },
+            timeout=10.0
+        )
+        response.raise_for_status()
+        invalidate_grocy_snapshots(STOCK_ENDPOINT, VOLATILE_ENDPOINT)
 
-    # First, find the product ID
-    product_search = await find_product_id_by_name(product_name)
-    if not product_search.get("found"):
-        return {"success": False, "error": f"Product '{product_name}' not found in Grocy"}
+        logger.info(f"✅ Consumed {amount} of '{product_exact_name}' from inventory")
 
-    matches = product_search.get("matches", [])
-    if len(matches) > 1:
-        match_names = [m["name"] for m in matches]
+        return {
+            "success": True,
+            "message": f"Successfully consumed {amount} of '{product_exact_name}'",
+            "product_name": product_exact_name,
+            "amount": amount,
+            "spoiled": spoiled
+        }
+
+    except Exception as e:
+        logger.error(f"❌ Failed to consume stock: {_describe_error(e)}")
         return {
             "success": False,
-            "error": f"Multiple products found: {', '.join(match_names)}. Please be more specific."
+            "error": f"Failed to consume stock: {_describe_error(e)}"
         }
 
-    product_id = matches[0]["id"]
-    product_exact_name = matches[0]["name"]
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(
-                f"{GROCY_API_URL}/stock/products/{product_id}/add-to-shopping-list",
-                headers=get_grocy_headers(),
-                json={
-                    "product_id": product_id,
-                    "amount": amount
-                },
-                timeout=10.0
-            )
-            response.raise_for_status()
+async def add_stock(
+    product_name: str,
+    amount: float,
+    best_before_date: str = None,
+    price: float = None,
+    product_id: Optional[int] = None
+) -> Dict[str, Any]:
+    """Add stock to Grocy inventory"""
+    logger.info(f"📦 Adding {amount} of '{product_name}' to inventory")
+
+    if product_id is not None:
+        # Caller already knows the Grocy ID, so skip the catalog lookup
+        product_exact_name = product_name
+    else:
+        # First, find the product ID
+        product_search = await find_product_id_by_name(product_name)
+        if not product_search.get("found"):
+            # Auto-create the product if it doesn't exist
+            logger.info(f"🆕 Product '{product_name}' not found, creating it...")
+            create_result = await create_product(product_name)
 
-            logger.info(f"✅ Added '{product_exact_name}' to shopping list")
+            if not create_result.get("success"):
+                return {"success": False, "error": f"Product '{product_name}' not found and could not be created: {create_result.get('error')}"}
 
+            # create_product reports the new ID, so there's no need to re-fetch the catalog
+            if create_result.get("product_id") is not None:
+                product_search = {"found": True, "matches": [{"id": create_result["product_id"], "name": product_name}]}
+            else:
+                product_search = await find_product_id_by_name(product_name)
+            if not product_search.get("found"):
+                return {"success": False, "error": f"Product '{product_name}' was created but could not be found"}
+
+        matches = product_search.get("matches", [])
+        if len(matches) > 1:
+            match_names = [m["name"] for m in matches]
             return {
-                "success": True,
-                "message": f"Added {amount} of '{product_exact_name}' to shopping list",
-                "product_name": product_exact_name,
-                "amount": amount
+                "success": False,
+                "error": f"Multiple products found: {', '.join(match_names)}. Please be more specific."
             }
 
-        except Exception as e:
-            logger.error(f"❌ Failed to add to shopping list: {str(e)}")
+        product_id = matches[0]["id"]
+        product_exact_name = matches[0]["name"]
+
+    client = _get_grocy_client()
+    try:
+        # Build request body
+        body = {
+            "amount": amount,
+            "transaction_type": "purchase"
+        }
+
+        if best_before_date:
+            body["best_before_date"] = best_before_date
+
+        if price is not None:
+            body["price"] = price
+
+        response = await client.post(
+            f"/stock/products/{product_id}/add",
+            json=body,
+            timeout=10.0
+        )
+        response.raise_for_status()
+        invalidate_grocy_snapshots(STOCK_ENDPOINT, VOLATILE_ENDPOINT)
+
+        logger.info(f"✅ Added {amount} of '{product_exact_name}' to inventory")
+
+        return {
+            "success": True,
+            "message": f"Successfully added {amount} of '{product_exact_name}' to inventory",
+            "product_name": product_exact_name,
+            "amount": amount,
+            "best_before_date": best_before_date,
+            "price": price
+        }
+
+    except Exception as e:
+        logger.error(f"❌ Failed to add stock: {_describe_error(e)}")
+        return {
+            "success": False,
+            "error": f"Failed to add stock: {_describe_error(e)}"
+        }
+
+
+async def add_to_shopping_list(product_name: str, amount: float = 1, product_id: Optional[int] = None) -> Dict[str, Any]:
+    """Add item to Grocy shopping list"""
+    logger.info(f"🛒 Adding {amount} of '{product_name}' to shopping list")
+
+    if product_id is not None:
+        # Caller already knows the Grocy ID, so skip the catalog lookup
+        product_exact_name = product_name
+    else:
+        # First, find the product ID
+        product_search = await find_product_id_by_name(product_name)
+        if not product_search.get("found"):
+            return {"success": False, "error": f"Product '{product_name}' not found in Grocy"}
+
+        matches = product_search.get("matches", [])
+        if len(matches) > 1:
+            match_names = [m["name"] for m in matches]
             return {
                 "success": False,
-                "error": f"Failed to add to shopping list: {str(e)}"
+                "error": f"Multiple products found: {', '.join(match_names)}. Please be more specific."
             }
 
+        product_id = matches[0]["id"]
+        product_exact_name = matches[0]["name"]
+
+    client = _get_grocy_client()
+    try:
+        response = await client.post(
+            f"/stock/products/{product_id}/add-to-shopping-list",
+            json={
+                "product_id": product_id,
+                "amount": amount
+            },
+            timeout=10.0
+        )
+        response.raise_for_status()
+
+        logger.info(f"✅ Added '{product_exact_name}' to shopping list")
+
+        return {
+            "success": True,
+            "message": f"Added {amount} of '{product_exact_name}' to shopping list",
+            "product_name": product_exact_name,
+            "amount": amount
+        }
+
+    except Exception as e:
+        logger.error(f"❌ Failed to add to shopping list: {_describe_error(e)}")
+        return {
+            "success": False,
+            "error": f"Failed to add to shopping list: {_describe_error(e)}"
+        }
+
 
 async def get_shopping_list() -> Dict[str, Any]:
     """Get current shopping list from Grocy"""
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                f"{GROCY_API_URL}/objects/shopping_list",
-                headers=get_grocy_headers(),
-                timeout=10.0
-            )
-            response.raise_for_status()
-            shopping_list = response.json()
-
-            items = []
-            for item in shopping_list:
-                items.append({
-                    "product_id": item.get("product_id"),
-                    "amount": item.get("amount"),
-                    "note": item.get("note", "")
-                })
+    client = _get_grocy_client()
+    try:
+        response = await _get_with_retry(
+            client,
+            "/objects/shopping_list",
+            timeout=10.0
+        )
+        response.raise_for_status()
+        shopping_list = orjson.loads(response.content)
 
-            logger.info(f"✅ Retrieved shopping list with {len(items)} items")
+        # Project only the fields the model needs; Grocy rows carry many more
+        items = [
+            {"product_id": item.get("product_id"), "amount": item.get("amount"), "note": item.get("note", "")}
+            for item in shopping_list
+        ]
 
-            return {
-                "success": True,
-                "total_items": len(items),
-                "items": items
-            }
+        logger.info(f"✅ Retrieved shopping list with {len(items)} items")
 
-        except Exception as e:
-            logger.error(f"❌ Failed to get shopping list: {str(e)}")
-            return {
-                "success": False,
-                "error": f"Failed to get shopping list: {str(e)}"
-            }
+        return {
+            "success": True,
+            "total_items": len(items),
+            "items": items
+        }
+
+    except Exception as e:
+        logger.error(f"❌ Failed to get shopping list: {_describe_error(e)}")
+        return {
+            "success": False,
+            "error": f"Failed to get shopping list: {_describe_error(e)}"
+        }
 
 
 # ============================================================================
@@ -382,62 +811,68 @@ async def search_recipes_by_ingredients(ingredients: str, number: int = 5) -> Di
 
     logger.info(f"🔍 Searching Spoonacular for recipes with: {ingredients}")
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                "https://api.spoonacular.com/recipes/findByIngredients",
-                params={
-                    "apiKey": SPOONACULAR_API_KEY,
-                    "ingredients": ingredients,
-                    "number": number,
-                    "ranking": 2,  # Maximize used ingredients
-                    "ignorePantry": False
-                },
-                timeout=10.0
-            )
-            response.raise_for_status()
-            recipes = response.json()
-
-            # Simplify the response and calculate match percentage
-            simplified = []
-            for recipe in recipes:
-                used_count = len(recipe.get("usedIngredients", []))
-                missed_count = len(recipe.get("missedIngredients", []))
-                total_ingredients = used_count + missed_count
-
-                # Calculate match percentage
-                match_percentage = round((used_count / total_ingredients * 100) if total_ingredients > 0 else 0, 1)
-
-                # Get names of missing ingredients
-                missed_items = [ing.get("name") for ing in recipe.get("missedIngredients", [])]
-
-                simplified.append({
-                    "id": recipe.get("id"),
-                    "title": recipe.get("title"),
-                    "image": recipe.get("image"),
-                    "usedIngredients": used_count,
-                    "matchPercentage": match_percentage,
-                    "missedIngredients": missed_items
-                })
+    cache_key = _ingredient_search_key(ingredients, number)
+    cached = await _cache_get(cache_key, ttl=INGREDIENT_SEARCH_TTL, empty_ttl=EMPTY_SEARCH_TTL)
+    if cached is not None:
+        logger.info(f"💾 Using cached Spoonacular search ({cached.get('total_recipes', 0)} recipes)")
+        return cached
 
-            # Sort by match percentage (highest first)
-            simplified.sort(key=lambda x: x["matchPercentage"], reverse=True)
+    return await _spoonacular_shared(
+        cache_key, lambda: _fetch_ingredient_search(ingredients, number, cache_key)
+    )
 
-            logger.info(f"✅ Found {len(simplified)} recipes from Spoonacular (sorted by match %)")
 
-            return {
-                "success": True,
-                "total_recipes": len(simplified),
-                "recipes": simplified
+async def _fetch_ingredient_search(ingredients: str, number: int, cache_key: str) -> Dict[str, Any]:
+    """Run a findByIngredients search and cache the simplified result"""
+    try:
+        response = await _spoonacular_get(
+            "/recipes/findByIngredients",
+            {
+                "ingredients": ingredients,
+                "number": number,
+                "ranking": 2,  # Maximize used ingredients
+                "ignorePantry": False
             }
+        )
+        response.raise_for_status()
+        recipes = orjson.loads(response.content)
+
+        # Simplify the response and calculate match percentage
+        def simplify(recipe: dict) -> dict:
+            used_count = len(recipe.get("usedIngredients", []))
+            # Get names of missing ingredients
+            missed_items = [ing.get("name") for ing in recipe.get("missedIngredients", [])]
+            total_ingredients = used_count + len(missed_items)
 
-        except Exception as e:
-            logger.error(f"❌ Spoonacular search failed: {str(e)}")
             return {
-                "success": False,
-                "error": f"Failed to search recipes: {str(e)}"
+                "id": recipe.get("id"),
+                "title": recipe.get("title"),
+                "image": recipe.get("image"),
+                "usedIngredients": used_count,
+                "matchPercentage": round(used_count / total_ingredients * 100, 1) if total_ingredients else 0,
+                "missedIngredients": missed_items
             }
 
+        # Keep the best `number` by match percentage (highest first, ties in API order)
+        simplified = heapq.nlargest(number, map(simplify, recipes), key=itemgetter("matchPercentage"))
+
+        logger.info(f"✅ Found {len(simplified)} recipes from Spoonacular (sorted by match %)")
+
+        result = {
+            "success": True,
+            "total_recipes": len(simplified),
+            "recipes": simplified
+        }
+        await _cache_set(cache_key, result)
+        return result
+
+    except Exception as e:
+        logger.error(f"❌ Spoonacular search failed: {_describe_error(e)}")
+        return {
+            "success": False,
+            "error": f"Failed to search recipes: {_describe_error(e)}"
+        }
+
 
 async def get_recipe_details(recipe_id: int) -> Dict[str, Any]:
     """Get full recipe details including instructions from Spoonacular"""
@@ -446,54 +881,89 @@ async def get_recipe_details(recipe_id: int) -> Dict[str, Any]:
 
     logger.info(f"📖 Getting recipe details for ID: {recipe_id}")
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                f"https://api.spoonacular.com/recipes/{recipe_id}/information",
-                params={
-                    "apiKey": SPOONACULAR_API_KEY,
-                    "includeNutrition": False
-                },
-                timeout=10.0
-            )
-            response.raise_for_status()
-            recipe = response.json()
-
-            # Extract key information
-            # Store full text for display, and just names for product creation
-            ingredients = []
-            ingredient_names = []
-            for ing in recipe.get("extendedIngredients", []):
-                ingredients.append(ing.get("original", ""))  # Full text with quantities
-                ingredient_names.append(ing.get("name", ""))  # Just the ingredient name
-
-            instructions = []
-            if recipe.get("analyzedInstructions"):
-                for step in recipe["analyzedInstructions"][0].get("steps", []):
-                    instructions.append(f"{step.get('number')}. {step.get('step')}")
-            elif recipe.get("instructions"):
-                instructions = [recipe.get("instructions")]
-
-            logger.info(f"✅ Retrieved recipe: {recipe.get('title')} ({len(ingredients)} ingredients, {len(instructions)} steps)")
+    cache_key = f"recipe_{recipe_id}"
+    cached = await _cache_get(cache_key)
+    if cached is not None:
+        logger.info(f"💾 Using cached recipe: {cached.get('title')}")
+        return cached
 
-            return {
-                "success": True,
-                "title": recipe.get("title"),
-                "image": recipe.get("image"),
-                "servings": recipe.get("servings"),
-                "ready_in_minutes": recipe.get("readyInMinutes"),
-                "ingredients": ingredients,
-                "ingredient_names": ingredient_names,
-                "instructions": instructions,
-                "source_url": recipe.get("sourceUrl")
-            }
+    return await _spoonacular_shared(cache_key, lambda: _fetch_recipe_details(recipe_id, cache_key))
 
-        except Exception as e:
-            logger.error(f"❌ Failed to get recipe details: {str(e)}")
-            return {
-                "success": False,
-                "error": f"Failed to get recipe details: {str(e)}"
-            }
+
+async def _fetch_recipe_details(recipe_id: int, cache_key: str) -> Dict[str, Any]:
+    """Fetch a recipe's information from Spoonacular and cache the extracted fields"""
+    try:
+        response = await _spoonacular_get(
+            f"/recipes/{recipe_id}/information",
+            {"includeNutrition": False}
+        )
+        response.raise_for_status()
+        recipe = orjson.loads(response.content)
+
+        # Extract key information
+        # Store full text for display, and just names for product creation
+        ingredients = []
+        ingredient_names = []
+        for ing in recipe.get("extendedIngredients", []):
+            ingredients.append(ing.get("original", ""))  # Full text with quantities
+            ingredient_names.append(ing.get("name", ""))  # Just the ingredient name
+
+        instructions = []
+        if recipe.get("analyzedInstructions"):
+            for step in recipe["analyzedInstructions"][0].get("steps", []):
+                instructions.append(f"{step.get('number')}. {step.get('step')}")
+        elif recipe.get("instructions"):
+            instructions = [recipe.get("instructions")]
+
+        logger.info(f"✅ Retrieved recipe: {recipe.get('title')} ({len(ingredients)} ingredients, {len(instructions)} steps)")
+
+        result = {
+            "success": True,
+            "title": recipe.get("title"),
+            "image": recipe.get("image"),
+            "servings": recipe.get("servings"),
+            "ready_in_minutes": recipe.get("readyInMinutes"),
+            "ingredients": ingredients,
+            "ingredient_names": ingredient_names,
+            "instructions": instructions,
+            "source_url": recipe.get("sourceUrl")
+        }
+        await _cache_set(cache_key, result)
+        return result
+
+    except Exception as e:
+        logger.error(f"❌ Failed to get recipe details: {_describe_error(e)}")
+        return {
+            "success": False,
+            "error": f"Failed to get recipe details: {_describe_error(e)}"
+        }
+
+
+async def get_recipes_with_details(ingredients: str, number: int = 3) -> Dict[str, Any]:
+    """Search recipes by ingredients and fetch every hit's full details concurrently"""
+    hits = await search_recipes_by_ingredients(ingredients, number)
+    if not hits.get("success"):
+        return hits
+
+    # Detail fetches share the Spoonacular concurrency cap; one failure doesn't sink the rest
+    details = await asyncio.gather(
+        *(get_recipe_details(recipe["id"]) for recipe in hits["recipes"]),
+        return_exceptions=True
+    )
+
+    recipes = []
+    for recipe, detail in zip(hits["recipes"], details):
+        if isinstance(detail, Exception):
+            detail = {"success": False, "error": f"Failed to get recipe details: {_describe_error(detail)}"}
+        recipes.append({**recipe, "details": detail})
+
+    logger.info(f"✅ Fetched details for {len(recipes)} recipes")
+
+    return {
+        "success": True,
+        "total_recipes": len(recipes),
+        "recipes": recipes
+    }
 
 
 async def search_recipes_by_name(query: str, number: int = 5) -> Dict[str, Any]:
@@ -503,72 +973,81 @@ async def search_recipes_by_name(query: str, number: int = 5) -> Dict[str, Any]:
 
     logger.info(f"🔍 Searching Spoonacular for recipe: '{query}'")
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                "https://api.spoonacular.com/recipes/complexSearch",
-                params={
-                    "apiKey": SPOONACULAR_API_KEY,
-                    "query": query,
-                    "number": number,
-                    "addRecipeInformation": True,
-                    "fillIngredients": True,
-                    "instructionsRequired": True
-                },
-                timeout=10.0
-            )
-            response.raise_for_status()
-            data = response.json()
-            recipes = data.get("results", [])
-
-            # Simplify the response - format compatible with find_recipes for consistent UI
-            simplified = []
-            for recipe in recipes:
-                simplified.append({
-                    "id": recipe.get("id"),
-                    "title": recipe.get("title"),
-                    "image": recipe.get("image"),
-                    "readyInMinutes": recipe.get("readyInMinutes"),
-                    "servings": recipe.get("servings"),
-                    # Add fields for frontend compatibility (no pantry comparison for name search)
-                    "matchPercentage": 100,  # Name search means exact match
-                    "usedIngredients": 0,  # Not comparing to pantry
-                    "missedIngredients": []  # Unknown without pantry check
-                })
+    try:
+        response = await _spoonacular_get(
+            "/recipes/complexSearch",
+            {
+                "query": query,
+                "number": number,
+                "addRecipeInformation": True,
+                "fillIngredients": True,
+                "instructionsRequired": True
+            }
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        recipes = data.get("results", [])
+
+        # Simplify the response - format compatible with find_recipes for consistent UI
+        simplified = []
+        for recipe in recipes:
+            simplified.append({
+                "id": recipe.get("id"),
+                "title": recipe.get("title"),
+                "image": recipe.get("image"),
+                "readyInMinutes": recipe.get("readyInMinutes"),
+                "servings": recipe.get("servings"),
+                # Add fields for frontend compatibility (no pantry comparison for name search)
+                "matchPercentage": 100,  # Name search means exact match
+                "usedIngredients": 0,  # Not comparing to pantry
+                "missedIngredients": []  # Unknown without pantry check
+            })
 
-            logger.info(f"✅ Found {len(simplified)} recipes for '{query}'")
+        logger.info(f"✅ Found {len(simplified)} recipes for '{query}'")
 
-            return {
-                "success": True,
-                "total_recipes": len(simplified),
-                "recipes": simplified
-            }
+        return {
+            "success": True,
+            "total_recipes": len(simplified),
+            "recipes": simplified
+        }
 
-        except Exception as e:
-            logger.error(f"❌ Recipe name search failed: {str(e)}")
-            return {
-                "success": False,
-                "error": f"Failed to search recipes: {str(e)}"
-            }
+    except Exception as e:
+        logger.error(f"❌ Recipe name search failed: {_describe_error(e)}")
+        return {
+            "success": False,
+            "error": f"Failed to search recipes: {_describe_error(e)}"
+        }
 
 
-async def save_recipe(recipe_name: str, recipe_content: str) -> Dict[str, Any]:
-    """Save a recipe to filesystem"""
-    safe_name = recipe_name.lower().replace(" ", "_").replace("/", "_")
+# Spaces and path separators become underscores in one pass (also keeps names inside RECIPE_DIR)
+_FILENAME_TABLE = str.maketrans({" ": "_", "/": "_", "\\": "_"})
+
+
+def _recipe_filename(recipe_name: str) -> str:
+    """Map a recipe name to its file name in RECIPE_DIR"""
+    safe_name = recipe_name.lower().translate(_FILENAME_TABLE)
     if not safe_name.endswith(".txt"):
         safe_name += ".txt"
+    return safe_name
+
 
-    recipe_path = RECIPE_DIR / safe_name
+async def save_recipe(recipe_name: str, recipe_content: str) -> Dict[str, Any]:
+    """Save a recipe to filesystem"""
+    global _recipe_list_cache
+    recipe_path = RECIPE_DIR / _recipe_filename(recipe_name)
 
     try:
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = datetime.now().isoformat(sep=" ", timespec="seconds")
         full_content = f"""# {recipe_name.title()}
 # Created: {timestamp}
 # Source: PantryBot
 
 {recipe_content}
 """
-        recipe_path.write_text(full_content, encoding="utf-8")
+        await asyncio.to_thread(_write_file_atomic, recipe_path, full_content.encode("utf-8"))
+
+        # Overwriting an existing file doesn't touch the directory mtime
+        _recipe_list_cache = None
 
         return {
             "success": True,
@@ -580,10 +1059,14 @@ async def save_recipe(recipe_name: str, recipe_content: str) -> Dict[str, Any]:
     except Exception as e:
         return {
             "success": False,
-            "error": f"Failed to save recipe: {str(e)}"
+            "error": f"Failed to save recipe: {_describe_error(e)}"
         }
 
 
+# Grocy requests in flight at once while resolving and linking a recipe's ingredients
+INGREDIENT_CONCURRENCY = 8
+
+
 async def save_recipe_to_grocy(
     recipe_id: int,
     recipe_title: str,
@@ -607,202 +1090,230 @@ async def save_recipe_to_grocy(
 
     logger.info(f"💾 Saving recipe '{recipe_title}' to Grocy...")
 
-    async with httpx.AsyncClient() as client:
-        try:
-            # 1. Create the recipe in Grocy
-            recipe_data = {
-                "name": recipe_title,
-                "description": f"From Spoonacular (ID: {recipe_id})\nCook time: {ready_in_minutes} min\nServings: {servings}",
-                "base_servings": servings,
-                "desired_servings": servings,
-                "type": "normal"
-            }
+    client = _get_grocy_client()
+    try:
+        # Match each distinct ingredient against one products snapshot, preferring an
+        # exact name over the first partial match, so repeated names can't race to
+        # create the same product and creates don't force catalog refetches.
+        # These lookups run before the recipe is created, so a failure here can't leave
+        # a half-saved recipe behind for a retry to duplicate.
+        resolved: Dict[str, Optional[int]] = {}
+        missing = []
+        if ingredient_names:
+            products, names_lower, by_exact_name = await _fetch_snapshot(PRODUCTS_ENDPOINT)
+            for name in dict.fromkeys(ingredient_names):
+                needle = name.lower()
+                product = by_exact_name.get(needle) or next(
+                    (p for p, name_lower in zip(products, names_lower) if needle in name_lower), None
+                )
+                if product is not None:
+                    resolved[name] = product["id"]
+                else:
+                    missing.append(name)
+
+        # Location and unit for new products are resolved once for the whole recipe
+        if missing:
+            location_id, unit_id = await _get_product_defaults("Pantry", "piece")
+
+        # 1. Create the recipe in Grocy
+        recipe_data = {
+            "name": recipe_title,
+            "description": f"From Spoonacular (ID: {recipe_id})\nCook time: {ready_in_minutes} min\nServings: {servings}",
+            "base_servings": servings,
+            "desired_servings": servings,
+            "type": "normal"
+        }
 
-            # Add image URL to description if provided
-            if image_url:
-                recipe_data["description"] += f"\n\nImage: {image_url}"
-
-            # Add ingredients to description
-            if ingredients:
-                recipe_data["description"] += "\n\nIngredients:\n" + "\n".join(f"• {ing}" for ing in ingredients)
-
-            # Add instructions to description
-            if instructions:
-                recipe_data["description"] += "\n\nInstructions:\n" + "\n".join(instructions)
-
-            recipe_response = await client.post(
-                f"{GROCY_API_URL}/objects/recipes",
-                headers=get_grocy_headers(),
-                json=recipe_data,
-                timeout=10.0
-            )
-            recipe_response.raise_for_status()
-            grocy_recipe = recipe_response.json()
-            grocy_recipe_id = grocy_recipe.get("created_object_id")
-
-            logger.info(f"✅ Created recipe in Grocy (ID: {grocy_recipe_id})")
-
-            # 2. Process ingredients and create missing products
-            # Use ingredient_names (just names) for product creation, but store full ingredients in notes
-            created_products = []
-            if ingredient_names:
-                for idx, ingredient_name in enumerate(ingredient_names):
-                    # Get full ingredient text for notes (if available)
-                    full_ingredient_text = ingredients[idx] if ingredients and idx < len(ingredients) else ingredient_name
-
-                    # Try to find existing product using just the name
-                    product_search = await find_product_id_by_name(ingredient_name)
-
-                    if not product_search.get("found"):
-                        # Product doesn't exist - create it at 0 quantity using just the name
-                        logger.info(f"🆕 Creating missing product: {ingredient_name}")
-                        create_result = await create_product(ingredient_name, location="Pantry", quantity_unit="piece")
-
-                        if create_result.get("success"):
-                            created_products.append(ingredient_name)
-                            # Re-search to get the new product ID
-                            product_search = await find_product_id_by_name(ingredient_name)
-
-                    # Add ingredient to recipe (if we have a product ID)
-                    if product_search.get("found"):
-                        product_id = product_search.get("product_id")
-
-                        # Create recipe ingredient link
-                        recipe_pos_data = {
-                            "recipe_id": grocy_recipe_id,
-                            "product_id": product_id,
-                            "amount": 1,  # Default amount (Grocy uses generic units)
-                            "note": full_ingredient_text,  # Store full ingredient text with quantities
-                            "ingredient_group": "",
-                            "product_group": idx + 1  # Position in recipe
-                        }
-
-                        try:
-                            pos_response = await client.post(
-                                f"{GROCY_API_URL}/objects/recipes_pos",
-                                headers=get_grocy_headers(),
-                                json=recipe_pos_data,
-                                timeout=10.0
-                            )
-                            if pos_response.status_code >= 400:
-                                logger.error(f"❌ Failed to link ingredient '{ingredient_name}': HTTP {pos_response.status_code} - {pos_response.text}")
-                            else:
-                                logger.info(f"✅ Linked ingredient: {ingredient_name}")
-                        except Exception as e:
-                            logger.error(f"❌ Error linking ingredient '{ingredient_name}': {str(e)}")
-
-            logger.info(f"✅ Recipe saved to Grocy with {len(ingredient_names or [])} ingredients")
-            if created_products:
-                logger.info(f"🆕 Created {len(created_products)} new products: {', '.join(created_products)}")
+        # Add image URL to description if provided
+        if image_url:
+            recipe_data["description"] += f"\n\nImage: {image_url}"
 
-            return {
-                "success": True,
-                "message": f"Recipe '{recipe_title}' saved to Grocy",
-                "grocy_recipe_id": grocy_recipe_id,
-                "created_products": created_products,
-                "total_ingredients": len(ingredient_names or [])
-            }
+        # Add ingredients to description
+        if ingredients:
+            recipe_data["description"] += "\n\nIngredients:\n" + "\n".join(f"• {ing}" for ing in ingredients)
 
-        except Exception as e:
-            logger.error(f"❌ Failed to save recipe to Grocy: {str(e)}")
-            return {
-                "success": False,
-                "error": f"Failed to save recipe: {str(e)}"
-            }
+        # Add instructions to description
+        if instructions:
+            recipe_data["description"] += "\n\nInstructions:\n" + "\n".join(instructions)
 
+        recipe_response = await client.post(
+            "/objects/recipes",
+            json=recipe_data,
+            timeout=10.0
+        )
+        recipe_response.raise_for_status()
+        invalidate_grocy_snapshots(RECIPES_ENDPOINT)
+        grocy_recipe = orjson.loads(recipe_response.content)
+        grocy_recipe_id = grocy_recipe.get("created_object_id")
+
+        logger.info(f"✅ Created recipe in Grocy (ID: {grocy_recipe_id})")
+
+        # 2. Process ingredients and create missing products
+        # Use ingredient_names (just names) for product creation, but store full ingredients in notes
+        created_products = []
+        if ingredient_names:
+            semaphore = asyncio.Semaphore(INGREDIENT_CONCURRENCY)
+
+            async def create_missing_product(ingredient_name: str, location_id: int, unit_id: int) -> Optional[int]:
+                """Create a product at 0 quantity using just the name; returns its ID"""
+                async with semaphore:
+                    logger.info(f"🆕 Creating missing product: {ingredient_name}")
+                    create_result = await _create_product_with_ids(ingredient_name, location_id, unit_id)
+                    return create_result.get("product_id") if create_result.get("success") else None
+
+            async def link_ingredient(idx: int, ingredient_name: str, product_id: int) -> None:
+                # Get full ingredient text for notes (if available)
+                full_ingredient_text = ingredients[idx] if ingredients and idx < len(ingredients) else ingredient_name
+
+                # Create recipe ingredient link
+                recipe_pos_data = {
+                    "recipe_id": grocy_recipe_id,
+                    "product_id": product_id,
+                    "amount": 1,  # Default amount (Grocy uses generic units)
+                    "note": full_ingredient_text,  # Store full ingredient text with quantities
+                    "ingredient_group": "",
+                    "product_group": idx + 1  # Position in recipe
+                }
 
-async def get_grocy_recipes() -> Dict[str, Any]:
-    """Get all recipes from Grocy database"""
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                f"{GROCY_API_URL}/objects/recipes",
-                headers=get_grocy_headers(),
-                timeout=10.0
-            )
-            response.raise_for_status()
-            recipes = response.json()
-
-            # Extract image URLs from descriptions
-            simplified = []
-            for recipe in recipes:
-                description = recipe.get("description", "")
-
-                # Extract image URL if present
-                image_url = None
-                if "Image: " in description:
-                    lines = description.split("\n")
-                    for line in lines:
-                        if line.startswith("Image: "):
-                            image_url = line.replace("Image: ", "").strip()
-                            break
-
-                simplified.append({
-                    "id": recipe.get("id"),
-                    "name": recipe.get("name"),
-                    "description": description,
-                    "servings": recipe.get("base_servings"),
-                    "image_url": image_url
-                })
+                async with semaphore:
+                    try:
+                        pos_response = await client.post(
+                            "/objects/recipes_pos",
+                            json=recipe_pos_data,
+                            timeout=10.0
+                        )
+                        if pos_response.status_code >= 400:
+                            logger.error(f"❌ Failed to link ingredient '{ingredient_name}': HTTP {pos_response.status_code} - {pos_response.text}")
+                        else:
+                            logger.info(f"✅ Linked ingredient: {ingredient_name}")
+                    except Exception as e:
+                        logger.error(f"❌ Error linking ingredient '{ingredient_name}': {_describe_error(e)}")
+
+            # Create all missing products in one wave
+            if missing:
+                new_ids = await asyncio.gather(*(
+                    create_missing_product(name, location_id, unit_id) for name in missing
+                ))
+                resolved.update(zip(missing, new_ids))
+                created_products = [name for name, new_id in zip(missing, new_ids) if new_id is not None]
+
+            # Then link every ingredient that has a product, in parallel
+            await asyncio.gather(*(
+                link_ingredient(idx, name, resolved[name])
+                for idx, name in enumerate(ingredient_names)
+                if resolved[name] is not None
+            ))
+
+        logger.info(f"✅ Recipe saved to Grocy with {len(ingredient_names or [])} ingredients")
+        if created_products:
+            logger.info(f"🆕 Created {len(created_products)} new products: {', '.join(created_products)}")
 
-            return {
-                "success": True,
-                "total_recipes": len(simplified),
-                "recipes": simplified
-            }
+        return {
+            "success": True,
+            "message": f"Recipe '{recipe_title}' saved to Grocy",
+            "grocy_recipe_id": grocy_recipe_id,
+            "created_products": created_products,
+            "total_ingredients": len(ingredient_names or [])
+        }
 
-        except Exception as e:
-            logger.error(f"❌ Failed to get Grocy recipes: {str(e)}")
-            return {
-                "success": False,
-                "error": f"Failed to fetch recipes: {str(e)}"
-            }
+    except Exception as e:
+        logger.error(f"❌ Failed to save recipe to Grocy: {_describe_error(e)}")
+        return {
+            "success": False,
+            "error": f"Failed to save recipe: {_describe_error(e)}"
+        }
+
+
+# save_recipe_to_grocy appends the image as its own "Image: <url>" line
+RECIPE_IMAGE_LINE = re.compile(r"^Image: (.*)", re.MULTILINE)
+
+
+async def get_grocy_recipes(limit: Optional[int] = None) -> Dict[str, Any]:
+    """Get recipes from Grocy database (the first `limit` of them, if given)"""
+    try:
+        recipes = await _fetch_snapshot(RECIPES_ENDPOINT)
+
+        # Extract image URLs from descriptions, only for the recipes actually returned
+        simplified = []
+        for recipe in islice(recipes, limit):
+            description = recipe.get("description", "")
+
+            # Extract image URL if present
+            match = RECIPE_IMAGE_LINE.search(description) if description else None
+            image_url = match.group(1).strip() if match else None
+
+            simplified.append({
+                "id": recipe.get("id"),
+                "name": recipe.get("name"),
+                "description": description,
+                "servings": recipe.get("base_servings"),
+                "image_url": image_url
+            })
+
+        result = {
+            "success": True,
+            "total_recipes": len(simplified),
+            "recipes": simplified
+        }
+        if len(simplified) < len(recipes):
+            result["more_recipes"] = True
+        return result
+
+    except Exception as e:
+        logger.error(f"❌ Failed to get Grocy recipes: {_describe_error(e)}")
+        return {
+            "success": False,
+            "error": f"Failed to fetch recipes: {_describe_error(e)}"
+        }
 
 
 async def get_grocy_recipe_by_id(recipe_id: int) -> Dict[str, Any]:
     """Get a specific recipe from Grocy by ID"""
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                f"{GROCY_API_URL}/objects/recipes/{recipe_id}",
-                headers=get_grocy_headers(),
-                timeout=10.0
-            )
-            response.raise_for_status()
-            recipe = response.json()
+    client = _get_grocy_client()
+    try:
+        response = await _get_with_retry(
+            client,
+            f"/objects/recipes/{recipe_id}",
+            timeout=10.0
+        )
+        response.raise_for_status()
+        recipe = orjson.loads(response.content)
 
-            return {
-                "success": True,
-                "recipe": recipe
-            }
+        return {
+            "success": True,
+            "recipe": recipe
+        }
 
-        except Exception as e:
-            logger.error(f"❌ Failed to get Grocy recipe: {str(e)}")
-            return {
-                "success": False,
-                "error": f"Failed to fetch recipe: {str(e)}"
-            }
+    except Exception as e:
+        logger.error(f"❌ Failed to get Grocy recipe: {_describe_error(e)}")
+        return {
+            "success": False,
+            "error": f"Failed to fetch recipe: {_describe_error(e)}"
+        }
+
+
+def _read_recipe_file(recipe_path: Path) -> Optional[str]:
+    """Blocking read of a recipe file, or None if it doesn't exist; run via asyncio.to_thread"""
+    try:
+        return recipe_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
 
 
 async def get_recipe(recipe_name: str) -> Dict[str, Any]:
     """Read a recipe from filesystem"""
-    safe_name = recipe_name.lower().replace(" ", "_")
-    if not safe_name.endswith(".txt"):
-        safe_name += ".txt"
-
-    recipe_path = RECIPE_DIR / safe_name
+    recipe_path = RECIPE_DIR / _recipe_filename(recipe_name)
 
     try:
-        if recipe_path.exists():
-            content = recipe_path.read_text(encoding="utf-8")
+        content = await asyncio.to_thread(_read_recipe_file, recipe_path)
+        if content is not None:
             return {
                 "success": True,
                 "recipe_name": recipe_name,
                 "content": content
             }
         else:
-            available = [f.stem.replace("_", " ").title()
-                        for f in RECIPE_DIR.glob("*.txt")]
+            available = [recipe["name"] for recipe in await asyncio.to_thread(_scan_recipe_dir)]
             return {
                 "success": False,
                 "error": f"Recipe '{recipe_name}' not found",
@@ -812,23 +1323,47 @@ async def get_recipe(recipe_name: str) -> Dict[str, Any]:
     except Exception as e:
         return {
             "success": False,
-            "error": f"Failed to read recipe: {str(e)}"
+            "error": f"Failed to read recipe: {_describe_error(e)}"
         }
 
 
+# Last directory scan, keyed by RECIPE_DIR's mtime (changes whenever a file is added or removed)
+_recipe_list_cache: Optional[Tuple[int, list]] = None
+
+
+def _scan_recipe_dir() -> list:
+    """Blocking scan of RECIPE_DIR; run via asyncio.to_thread"""
+    global _recipe_list_cache
+    try:
+        dir_mtime = RECIPE_DIR.stat().st_mtime_ns
+    except FileNotFoundError:
+        # Created at import, but may have been removed since
+        return []
+    if _recipe_list_cache is not None and _recipe_list_cache[0] == dir_mtime:
+        return _recipe_list_cache[1]
+
+    recipes = []
+    with os.scandir(RECIPE_DIR) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".txt") or not entry.is_file():
+                continue
+            stat = entry.stat()
+            recipes.append({
+                "name": entry.name[:-4].replace("_", " ").title(),
+                "filename": entry.name,
+                "size_kb": round(stat.st_size / 1024, 2),
+                "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(sep=" ", timespec="minutes")
+            })
+    recipes.sort(key=lambda recipe: recipe["filename"])
+
+    _recipe_list_cache = (dir_mtime, recipes)
+    return recipes
+
+
 async def list_recipes() -> Dict[str, Any]:
     """List all saved recipes"""
     try:
-        recipes = []
-        if RECIPE_DIR.exists():
-            for recipe_file in sorted(RECIPE_DIR.glob("*.txt")):
-                stat = recipe_file.stat()
-                recipes.append({
-                    "name": recipe_file.stem.replace("_", " ").title(),
-                    "filename": recipe_file.name,
-                    "size_kb": round(stat.st_size / 1024, 2),
-                    "modified": datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M")
-                })
+        recipes = await asyncio.to_thread(_scan_recipe_dir)
 
         return {
             "success": True,
@@ -839,7 +1374,7 @@ async def list_recipes() -> Dict[str, Any]:
     except Exception as e:
         return {
             "success": False,
-            "error": f"Failed to list recipes: {str(e)}"
+            "error": f"Failed to list recipes: {_describe_error(e)}"
         }
 """
 Extended Grocy API Tools
@@ -848,13 +1383,27 @@ Additional convenience functions for chores, tasks, batteries, and more
 
 import httpx
 from typing import Dict, Any, Optional
-from pantry_tools import get_grocy_headers, GROCY_API_URL
 
 
 # ============================================================================
 # GENERIC GROCY API ACCESS
 # ============================================================================
 
+# Methods the generic endpoint accepts, and which of them carry a JSON body
+GROCY_API_METHODS = {"GET", "POST", "PUT", "DELETE"}
+GROCY_BODY_METHODS = {"POST", "PUT"}
+# Bodies are serialized with orjson, matching how responses are decoded
+JSON_CONTENT_TYPE = {"content-type": "application/json"}
+
+
+_grocy_gets_in_flight: Dict[str, asyncio.Task] = {}
+
+
+def _is_error(result: Any) -> bool:
+    """True for the {"success": False, ...} dicts grocy_api and the tools return on failure"""
+    return isinstance(result, dict) and result.get("success") is False
+
+
 async def grocy_api(
     endpoint: str,
     method: str = "GET",
@@ -884,39 +1433,102 @@ async def grocy_api(
     Returns:
         JSON response from Grocy API
     """
-    url = f"{GROCY_API_URL}{endpoint}"
+    if method not in GROCY_API_METHODS:
+        return {"success": False, "error": f"Unsupported method: {method}"}
+
+    if method != "GET":
+        # A read that started before this write must not be handed to later callers
+        _grocy_gets_in_flight.clear()
+        return await _grocy_request(method, endpoint, body)
+
+    # Concurrent reads of the same endpoint (e.g. parallel tool calls) share one request
+    task = _grocy_gets_in_flight.get(endpoint)
+    if task is None:
+        task = asyncio.create_task(_grocy_request(method, endpoint, None))
+        _grocy_gets_in_flight[endpoint] = task
+        task.add_done_callback(
+            lambda t: _grocy_gets_in_flight.get(endpoint) is t and _grocy_gets_in_flight.pop(endpoint)
+        )
+    # Shielded so one cancelled caller doesn't cancel the read for the others
+    return await asyncio.shield(task)
 
-    async with httpx.AsyncClient() as client:
-        try:
-            if method == "GET":
-                response = await client.get(url, headers=get_grocy_headers(), timeout=10.0)
-            elif method == "POST":
-                response = await client.post(url, headers=get_grocy_headers(), json=body, timeout=10.0)
-            elif method == "PUT":
-                response = await client.put(url, headers=get_grocy_headers(), json=body, timeout=10.0)
-            elif method == "DELETE":
-                response = await client.delete(url, headers=get_grocy_headers(), timeout=10.0)
-            else:
-                return {"success": False, "error": f"Unsupported method: {method}"}
 
-            if response.status_code >= 400:
-                return {
-                    "success": False,
-                    "error": f"HTTP {response.status_code}: {response.text}"
-                }
+async def _grocy_request(method: str, endpoint: str, body: Optional[Dict[str, Any]]) -> Any:
+    """Send one grocy_api request, turning failures into error dicts"""
+    client = _get_grocy_client()
+    try:
+        payload = orjson.dumps(body) if body is not None and method in GROCY_BODY_METHODS else None
+        response = await client.request(
+            method,
+            endpoint,
+            content=payload,
+            headers=JSON_CONTENT_TYPE if payload is not None else None,
+            timeout=10.0
+        )
 
-            # Return raw JSON (Claude will interpret it)
-            if response.text:
-                return response.json()
-            else:
-                return {"success": True, "status_code": response.status_code}
+        if method != "GET":
+            for snapshot in SNAPSHOT_BUILDERS:
+                if snapshot not in WRITE_SCOPED_SNAPSHOTS or endpoint.startswith(WRITE_SCOPED_SNAPSHOTS[snapshot]):
+                    invalidate_grocy_snapshots(snapshot)
 
-        except Exception as e:
+        if response.status_code >= 400:
             return {
                 "success": False,
-                "error": f"Grocy API error: {str(e)}"
+                "error": f"HTTP {response.status_code}: {response.text}"
             }
 
+        # Return raw JSON (Claude will interpret it)
+        if response.content:
+            return orjson.loads(response.content)
+        else:
+            return {"success": True, "status_code": response.status_code}
+
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Grocy API error: {_describe_error(e)}"
+        }
+
+
+async def _run_named_action(
+    endpoint: str,
+    name: str,
+    action: str,
+    body: Optional[Dict[str, Any]] = None
+) -> Tuple[Optional[dict], Any]:
+    """
+    Find a chore/task/battery by name in its snapshot and POST its action
+    (e.g. "/chores/{id}/execute"). If the action fails, the list is refetched and
+    the action retried once in case the object was recreated in Grocy since.
+
+    Returns (object, grocy_api result), or (None, object list) when the name isn't
+    found, or (None, error) when the list can't be read.
+    """
+    for attempt in range(2):
+        try:
+            items, by_name = await _fetch_snapshot(endpoint)
+        except Exception as e:
+            return None, {"success": False, "error": f"Grocy API error: {_describe_error(e)}"}
+
+        obj = by_name.get(name.lower())
+        if not obj:
+            return None, items
+
+        result = await grocy_api(action.format(id=obj["id"]), method="POST", body=body)
+        if attempt or not _is_error(result):
+            return obj, result
+
+        # Only worth retrying if a fresh list resolves the name to a different ID
+        invalidate_grocy_snapshots(endpoint)
+        try:
+            _, by_name = await _fetch_snapshot(endpoint)
+        except Exception:
+            return obj, result
+        fresh = by_name.get(name.lower())
+        if not fresh or fresh["id"] == obj["id"]:
+            return obj, result
+    return obj, result
+
 
 # ============================================================================
 # CHORE MANAGEMENT
@@ -940,34 +1552,24 @@ async def complete_chore(chore_name: str) -> Dict[str, Any]:
     Returns:
         Success confirmation with next execution time
     """
-    # First, find the chore by name
-    chores_response = await grocy_api("/objects/chores")
-
-    if not chores_response or "success" in chores_response and not chores_response["success"]:
-        return chores_response
-
-    # Search for chore by name (case-insensitive)
-    chore = None
-    for c in chores_response:
-        if c.get("name", "").lower() == chore_name.lower():
-            chore = c
-            break
+    # Find the chore by name (case-insensitive, from the cached list) and execute it
+    chore, result = await _run_named_action(
+        CHORES_ENDPOINT,
+        chore_name,
+        "/chores/{id}/execute",
+        body={"tracked_time": None, "done_by": None}
+    )
 
     if not chore:
+        if isinstance(result, dict):
+            return result
         return {
             "success": False,
             "error": f"Chore '{chore_name}' not found",
-            "available_chores": [c.get("name") for c in chores_response]
+            "available_chores": [c.get("name") for c in result]
         }
 
-    # Execute the chore
-    result = await grocy_api(
-        f"/chores/{chore['id']}/execute",
-        method="POST",
-        body={"tracked_time": None, "done_by": None}
-    )
-
-    if "success" in result and not result["success"]:
+    if _is_error(result):
         return result
 
     return {
@@ -1009,7 +1611,7 @@ async def add_chore(
 
     result = await grocy_api("/objects/chores", method="POST", body=chore_data)
 
-    if "success" in result and not result["success"]:
+    if _is_error(result):
         return result
 
     return {
@@ -1029,7 +1631,7 @@ async def get_pending_tasks() -> Dict[str, Any]:
     """
     all_tasks = await grocy_api("/tasks")
 
-    if "success" in all_tasks and not all_tasks["success"]:
+    if _is_error(all_tasks):
         return all_tasks
 
     # Filter for incomplete tasks (Grocy /tasks endpoint already returns only incomplete)
@@ -1050,30 +1652,19 @@ async def complete_task(task_name: str) -> Dict[str, Any]:
     Returns:
         Success confirmation
     """
-    # Get all tasks
-    tasks_response = await grocy_api("/objects/tasks")
-
-    if not tasks_response or "success" in tasks_response and not tasks_response["success"]:
-        return tasks_response
-
-    # Find task by name (case-insensitive)
-    task = None
-    for t in tasks_response:
-        if t.get("name", "").lower() == task_name.lower():
-            task = t
-            break
+    # Find task by name (case-insensitive, from the cached list) and complete it
+    task, result = await _run_named_action(TASKS_ENDPOINT, task_name, "/tasks/{id}/complete")
 
     if not task:
+        if isinstance(result, dict):
+            return result
         return {
             "success": False,
             "error": f"Task '{task_name}' not found",
-            "available_tasks": [t.get("name") for t in tasks_response if not t.get("done")]
+            "available_tasks": [t.get("name") for t in result if not t.get("done")]
         }
 
-    # Complete the task
-    result = await grocy_api(f"/tasks/{task['id']}/complete", method="POST")
-
-    if "success" in result and not result["success"]:
+    if _is_error(result):
         return result
 
     return {
@@ -1102,7 +1693,7 @@ async def add_task(name: str, due_date: Optional[str] = None) -> Dict[str, Any]:
 
     result = await grocy_api("/objects/tasks", method="POST", body=task_data)
 
-    if "success" in result and not result["success"]:
+    if _is_error(result):
         return result
 
     return {
@@ -1134,34 +1725,24 @@ async def charge_battery(battery_name: str) -> Dict[str, Any]:
     Returns:
         Success confirmation with next charge date
     """
-    # Get all batteries
-    batteries_response = await grocy_api("/objects/batteries")
-
-    if not batteries_response or "success" in batteries_response and not batteries_response["success"]:
-        return batteries_response
-
-    # Find battery by name (case-insensitive)
-    battery = None
-    for b in batteries_response:
-        if b.get("name", "").lower() == battery_name.lower():
-            battery = b
-            break
+    # Find battery by name (case-insensitive, from the cached list) and track a charge cycle
+    battery, result = await _run_named_action(
+        BATTERIES_ENDPOINT,
+        battery_name,
+        "/batteries/{id}/charge",
+        body={"tracked_time": None}
+    )
 
     if not battery:
+        if isinstance(result, dict):
+            return result
         return {
             "success": False,
             "error": f"Battery '{battery_name}' not found",
-            "available_batteries": [b.get("name") for b in batteries_response]
+            "available_batteries": [b.get("name") for b in result]
         }
 
-    # Track charge cycle
-    result = await grocy_api(
-        f"/batteries/{battery['id']}/charge",
-        method="POST",
-        body={"tracked_time": None}
-    )
-
-    if "success" in result and not result["success"]:
+    if _is_error(result):
         return result
 
     return {
@@ -1194,39 +1775,68 @@ async def create_product(
     Returns:
         Success confirmation with product ID
     """
-    # First, get or create location
-    locations = await grocy_api("/objects/locations")
-    location_id = None
+    location_id, unit_id = await _get_product_defaults(location, quantity_unit)
+    result = await _create_product_with_ids(name, location_id, unit_id, min_stock_amount)
+    if not result.get("success"):
+        return result
+
+    return {
+        "success": True,
+        "message": f"Created product: {name} (added to stock at 0 quantity)",
+        "product_id": result["product_id"],
+        "name": name,
+        "location": location,
+        "unit": quantity_unit
+    }
+
+
+async def _find_object_by_name(endpoint: str, name: str) -> Optional[dict]:
+    """Look up a location/unit by name in its cached snapshot (None if missing or unreadable)"""
+    try:
+        _, by_name = await _fetch_snapshot(endpoint)
+    except Exception as e:
+        logger.warning(f"⚠️ Could not read {endpoint}: {_describe_error(e)}")
+        return None
+    return by_name.get(name.lower())
+
 
-    if isinstance(locations, list):
-        for loc in locations:
-            if loc.get("name", "").lower() == location.lower():
-                location_id = loc["id"]
-                break
+async def _get_product_defaults(location: str, quantity_unit: str) -> Tuple[int, int]:
+    """Resolve (location_id, unit_id) for new products, creating the location if needed"""
+    # The two lookups are independent, so run them together
+    loc, unit = await asyncio.gather(
+        _find_object_by_name(LOCATIONS_ENDPOINT, location),
+        _find_object_by_name(QUANTITY_UNITS_ENDPOINT, quantity_unit)
+    )
+
+    # First, get or create location
+    location_id = loc["id"] if loc else None
 
     if not location_id:
         # Create location
         loc_result = await grocy_api(
-            "/objects/locations",
+            LOCATIONS_ENDPOINT,
             method="POST",
             body={"name": location, "description": "Auto-created by PantryBot"}
         )
         location_id = loc_result.get("created_object_id", 1)
 
     # Get or create quantity unit
-    units = await grocy_api("/objects/quantity_units")
-    unit_id = None
-
-    if isinstance(units, list):
-        for unit in units:
-            if unit.get("name", "").lower() == quantity_unit.lower():
-                unit_id = unit["id"]
-                break
+    unit_id = unit["id"] if unit else None
 
     if not unit_id:
         # Use default unit (1) if not found
         unit_id = 1
 
+    return location_id, unit_id
+
+
+async def _create_product_with_ids(
+    name: str,
+    location_id: int,
+    unit_id: int,
+    min_stock_amount: int = 0
+) -> Dict[str, Any]:
+    """Create a product (plus its 0-quantity stock entry) from already-resolved IDs"""
     # Create product
     product_data = {
         "name": name,
@@ -1239,16 +1849,15 @@ async def create_product(
 
     result = await grocy_api("/objects/products", method="POST", body=product_data)
 
-    if "success" in result and not result["success"]:
+    if _is_error(result):
         return result
 
     product_id = result.get("created_object_id")
 
     # Add initial stock entry at 0 quantity so it shows in Stock Overview
-    from datetime import datetime, timedelta
     initial_stock_data = {
         "amount": 0,
-        "best_before_date": (datetime.now() + timedelta(days=365)).strftime("%Y-%m-%d"),
+        "best_before_date": (datetime.now() + timedelta(days=365)).date().isoformat(),
         "price": 0
     }
 
@@ -1260,19 +1869,21 @@ async def create_product(
 
     logger.info(f"✅ Created product '{name}' with initial 0 stock entry")
 
-    return {
-        "success": True,
-        "message": f"Created product: {name} (added to stock at 0 quantity)",
-        "product_id": product_id,
-        "location": location,
-        "unit": quantity_unit
-    }
+    return {"success": True, "product_id": product_id}
 
 
 # ============================================================================
 # STOCK MONITORING
 # ============================================================================
 
+async def _get_volatile() -> Dict[str, Any]:
+    """/stock/volatile from its short-lived snapshot, or a grocy_api-style error"""
+    try:
+        return await _fetch_snapshot(VOLATILE_ENDPOINT)
+    except Exception as e:
+        return {"success": False, "error": f"Grocy API error: {_describe_error(e)}"}
+
+
 async def get_expiring_soon(days: int = 7) -> Dict[str, Any]:
     """
     Get products that are expiring soon.
@@ -1283,9 +1894,9 @@ async def get_expiring_soon(days: int = 7) -> Dict[str, Any]:
     Returns:
         List of products expiring within the specified days
     """
-    volatile = await grocy_api("/stock/volatile")
+    volatile = await _get_volatile()
 
-    if "success" in volatile and not volatile["success"]:
+    if _is_error(volatile):
         return volatile
 
     # Extract expiring and expired products
@@ -1304,9 +1915,9 @@ async def get_missing_products() -> Dict[str, Any]:
     """
     Get products that are below minimum stock level.
     """
-    volatile = await grocy_api("/stock/volatile")
+    volatile = await _get_volatile()
 
-    if "success" in volatile and not volatile["success"]:
+    if _is_error(volatile):
         return volatile
 
     missing = volatile.get("missing_products", [])
@@ -1334,7 +1945,7 @@ async def add_missing_to_shopping_list(shopping_list_id: int = 1) -> Dict[str, A
         body={"list_id": shopping_list_id}
     )
 
-    if "success" in result and not result["success"]:
+    if _is_error(result):
         return result
 
     return {
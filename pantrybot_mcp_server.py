@@ -22,6 +22,7 @@ License: MIT
 """
 
 import asyncio
+from contextlib import asynccontextmanager
 from mcp.server.fastmcp import FastMCP
 
 # Import all shared tool functions
@@ -35,6 +36,7 @@ from pantry_tools import (
     search_recipes_by_ingredients,
     search_recipes_by_name,
     get_recipe_details,
+    get_recipes_with_details,
     save_recipe,
     save_recipe_to_grocy,
     get_recipe,
@@ -54,11 +56,25 @@ from pantry_tools import (
     create_product,
     get_expiring_soon,
     get_missing_products,
-    add_missing_to_shopping_list
+    add_missing_to_shopping_list,
+    warm_grocy_snapshots,
+    close_http_clients,
+    _describe_error
 )
 
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Warm the Grocy catalog snapshots on startup; release pooled HTTP connections on shutdown"""
+    warm_grocy_snapshots()
+    try:
+        yield
+    finally:
+        await close_http_clients()
+
+
 # Initialize MCP server
-mcp = FastMCP("PantryBot")
+mcp = FastMCP("PantryBot", lifespan=lifespan)
 
 
 # ============================================================================
@@ -102,7 +118,7 @@ async def get_product(product_name: str) -> dict:
 
 
 @mcp.tool()
-async def use_ingredients(product_name: str, amount: float, spoiled: bool = False) -> dict:
+async def use_ingredients(product_name: str, amount: float, spoiled: bool = False, product_id: int = None) -> dict:
     """
     Remove/consume items from pantry inventory in Grocy.
     Use this when the user says they used ingredients or made a recipe.
@@ -111,6 +127,7 @@ async def use_ingredients(product_name: str, amount: float, spoiled: bool = Fals
         product_name: Name of the product to consume (e.g., 'salmon', 'canned salmon')
         amount: Amount to consume/remove from inventory
         spoiled: Whether the item was spoiled (default: False)
+        product_id: Grocy product ID, if already known (skips the name lookup)
 
     Returns:
         Dictionary with success status and confirmation message
@@ -119,11 +136,17 @@ async def use_ingredients(product_name: str, amount: float, spoiled: bool = Fals
         "I made salmon cakes and used 2 cans of salmon"
         → use_ingredients("salmon", 2)
     """
-    return await consume_stock(product_name, amount, spoiled)
+    return await consume_stock(product_name, amount, spoiled, product_id)
 
 
 @mcp.tool()
-async def purchase_groceries(product_name: str, amount: float, best_before_date: str = None, price: float = None) -> dict:
+async def purchase_groceries(
+    product_name: str,
+    amount: float,
+    best_before_date: str = None,
+    price: float = None,
+    product_id: int = None
+) -> dict:
     """
     Add items to pantry inventory in Grocy.
     Use this when the user says they bought groceries or restocked items.
@@ -133,6 +156,7 @@ async def purchase_groceries(product_name: str, amount: float, best_before_date:
         amount: Amount to add to inventory
         best_before_date: Best before date in YYYY-MM-DD format (optional)
         price: Price paid for the item (optional)
+        product_id: Grocy product ID, if already known (skips the name lookup)
 
     Returns:
         Dictionary with success status and confirmation message
@@ -141,11 +165,11 @@ async def purchase_groceries(product_name: str, amount: float, best_before_date:
         "I bought 5 cans of salmon at the store"
         → purchase_groceries("salmon", 5)
     """
-    return await add_stock(product_name, amount, best_before_date, price)
+    return await add_stock(product_name, amount, best_before_date, price, product_id)
 
 
 @mcp.tool()
-async def add_to_shopping(product_name: str, amount: float = 1) -> dict:
+async def add_to_shopping(product_name: str, amount: float = 1, product_id: int = None) -> dict:
     """
     Add items to the Grocy shopping list.
     Use this when the user wants to remember to buy something.
@@ -153,6 +177,7 @@ async def add_to_shopping(product_name: str, amount: float = 1) -> dict:
     Args:
         product_name: Name of the product to add to shopping list
         amount: Amount to add to shopping list (default: 1)
+        product_id: Grocy product ID, if already known (skips the name lookup)
 
     Returns:
         Dictionary with success status and confirmation message
@@ -161,7 +186,7 @@ async def add_to_shopping(product_name: str, amount: float = 1) -> dict:
         "Add salmon to my shopping list"
         → add_to_shopping("salmon", 1)
     """
-    return await add_to_shopping_list(product_name, amount)
+    return await add_to_shopping_list(product_name, amount, product_id)
 
 
 @mcp.tool()
@@ -272,6 +297,30 @@ async def get_recipe_instructions(recipe_id: int) -> dict:
     return await get_recipe_details(recipe_id)
 
 
+@mcp.tool()
+async def find_recipes_with_details(ingredients: str, number: int = 3) -> dict:
+    """
+    Search for recipes by ingredients AND get each one's full instructions in ONE call.
+    Use this instead of find_recipes followed by several get_recipe_instructions calls.
+
+    Args:
+        ingredients: Comma-separated list of ingredients (e.g., 'salmon,lemon,dill')
+        number: Number of recipes to return (default: 3, max: 5)
+
+    Returns:
+        Dictionary with:
+            - success: bool
+            - total_recipes: int
+            - recipes: find_recipes results (highest match first), each with a
+              "details" entry shaped like get_recipe_instructions output
+
+    Example:
+        "Give me a couple of full recipes I can make with chicken and rice"
+        → find_recipes_with_details("chicken,rice", 2)
+    """
+    return await get_recipes_with_details(ingredients, min(number, 5))
+
+
 @mcp.tool()
 async def save_recipe_to_grocy_db(
     recipe_id: int,
@@ -360,7 +409,7 @@ async def get_saved_recipe(recipe_name: str) -> dict:
 
 
 @mcp.tool()
-async def list_saved_recipes() -> dict:
+async def list_saved_recipes(limit: int = 500) -> dict:
     """
     List all saved recipes from Grocy database.
 
@@ -368,11 +417,15 @@ async def list_saved_recipes() -> dict:
     check saved recipes FIRST before searching Spoonacular. These are recipes
     the user has already saved and likes!
 
+    Args:
+        limit: Maximum number of recipes to return (default: 500; 0 or less for all)
+
     Returns:
         Dictionary with:
             - success: bool
             - total_recipes: int
             - recipes: list of {id, name, description, servings, image_url, modified}
+            - more_recipes: True if more saved recipes exist beyond limit
 
     Example:
         User: "What's for supper?"
@@ -380,7 +433,8 @@ async def list_saved_recipes() -> dict:
         2. Match against get_pantry() to see what they can make
         3. If no good matches, then search Spoonacular
     """
-    return await get_grocy_recipes()
+    # A zero or negative limit (e.g. the model asking for "all") means no limit
+    return await get_grocy_recipes(limit if limit > 0 else None)
 
 
 # ============================================================================
@@ -626,10 +680,142 @@ async def auto_add_to_shopping_list() -> dict:
     return await add_missing_to_shopping_list()
 
 
+# ============================================================================
+# BATCH READ TOOL
+# ============================================================================
+
+# Read-only tools that batch_get can fan out to (keyed by MCP tool name)
+BATCH_READ_TOOLS = {
+    "get_pantry": get_pantry,
+    "get_product": get_product,
+    "view_shopping_list": view_shopping_list,
+    "list_saved_recipes": list_saved_recipes,
+    "get_saved_recipe": get_saved_recipe,
+    "get_recipe_instructions": get_recipe_instructions,
+    "check_expiring_products": check_expiring_products,
+    "check_low_stock": check_low_stock,
+}
+
+# Maximum number of batched reads in flight at once
+BATCH_CONCURRENCY = 8
+
+
+@mcp.tool()
+async def batch_get(operations: list) -> dict:
+    """
+    Fetch several read-only pantry/recipe resources in ONE call.
+    Prefer this over calling multiple read tools one after another.
+
+    Args:
+        operations: List of reads, each {"id": str, "tool": str, "parameters": dict}
+            tool must be one of: get_pantry, get_product, view_shopping_list,
+            list_saved_recipes, get_saved_recipe, get_recipe_instructions,
+            check_expiring_products, check_low_stock
+            parameters are the same arguments that tool normally takes
+
+    Returns:
+        Dictionary with:
+            - success: bool
+            - results: {id: result of that read} (a repeated id is keyed "id#position")
+
+    Example:
+        "What's for supper?"
+        → batch_get([
+            {"id": "pantry", "tool": "get_pantry"},
+            {"id": "saved", "tool": "list_saved_recipes"}
+          ])
+    """
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+    async def run_operation(operation: dict) -> dict:
+        # A malformed entry fails on its own instead of sinking the whole batch
+        if not isinstance(operation, dict):
+            return {"success": False, "error": "Each operation must be an object with a 'tool' field"}
+
+        tool_name = operation.get("tool")
+        tool = BATCH_READ_TOOLS.get(tool_name) if isinstance(tool_name, str) else None
+        if tool is None:
+            return {"success": False, "error": f"Tool '{tool_name}' is not available in batch_get"}
+
+        async with semaphore:
+            try:
+                return await tool(**(operation.get("parameters") or {}))
+            except Exception as e:
+                return {"success": False, "error": f"{tool_name} failed: {_describe_error(e)}"}
+
+    results = await asyncio.gather(*(run_operation(op) for op in operations))
+
+    # Key results by id; a missing id falls back to the position, and a repeated
+    # id gets "#<position>" appended so no result overwrites another
+    keyed_results = {}
+    for index, (op, result) in enumerate(zip(operations, results)):
+        key = str(op.get("id", index)) if isinstance(op, dict) else str(index)
+        if key in keyed_results:
+            key = f"{key}#{index}"
+        keyed_results[key] = result
+
+    return {
+        "success": True,
+        "results": keyed_results
+    }
+
+
+# ============================================================================
+# DASHBOARD TOOL
+# ============================================================================
+
+# Independent Grocy reads that make up the household overview (section → call)
+DASHBOARD_SECTIONS = {
+    "pantry": lambda: get_pantry_items("all"),
+    "expiring": lambda: get_expiring_soon(7),
+    "low_stock": get_missing_products,
+    "chores": get_chores_status,
+    "tasks": get_pending_tasks,
+    "batteries": get_batteries_status,
+}
+
+
+@mcp.tool()
+async def get_dashboard() -> dict:
+    """
+    Get a complete household overview in ONE call: pantry, expiring products,
+    low stock, chores, tasks and batteries.
+    Prefer this over calling those tools one after another.
+
+    Returns:
+        Dictionary with:
+            - success: bool
+            - pantry, expiring, low_stock, chores, tasks, batteries:
+              each section's result (an error dict if that section failed)
+
+    Example:
+        "What's going on in the house?" → get_dashboard()
+    """
+    # All sections are fetched concurrently; one failing doesn't sink the others
+    results = await asyncio.gather(
+        *(fetch() for fetch in DASHBOARD_SECTIONS.values()),
+        return_exceptions=True
+    )
+
+    dashboard = {"success": True}
+    for section, result in zip(DASHBOARD_SECTIONS, results):
+        if isinstance(result, Exception):
+            result = {"success": False, "error": f"{section} failed: {_describe_error(result)}"}
+        dashboard[section] = result
+    return dashboard
+
+
 # ============================================================================
 # RUN SERVER
 # ============================================================================
 
 if __name__ == "__main__":
+    # uvloop is optional (and unavailable on Windows); use it when installed
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     # Run the MCP server
     mcp.run()